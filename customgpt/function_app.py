@@ -3,15 +3,18 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import asyncio
 import json
 import logging
 import os
 import random
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import azure.functions as func
 import html2text
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from readability import Document
@@ -32,81 +35,202 @@ SERPER_API_KEY = os.environ.get("SERPER_API_KEY", "")
 
 app = func.FunctionApp()
 
-USER_AGENTS = [
+# Shared async HTTP client so connections are pooled across invocations.
+# Every request gets a bounded timeout so a slow server can't hang the worker.
+HTTP_CLIENT = httpx.AsyncClient(
+    follow_redirects=True,
+    timeout=httpx.Timeout(20.0, connect=5.0),
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+)
+
+# Worker threads for blocking work (HTML parsing/conversion, DuckDuckGo client),
+# sized so one request's scrape fan-out runs fully in parallel
+WORKER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="webcat-worker")
+
+# Only transient failures are worth retrying, anything else fails fast
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_ERRORS = (httpx.TimeoutException, httpx.NetworkError)
+BACKOFF_CAP = 10.0
+BACKOFF_JITTER = 1.0
+
+# Conditional-request cache: (url, markdown) -> (etag, last_modified, soup)
+PAGE_CACHE = {}
+PAGE_CACHE_MAX_ENTRIES = 256
+
+# Serper response cache: (query, gl, hl, api_key) -> (expires_at, results)
+SERPER_URL = "https://google.serper.dev/search"
+SERPER_CACHE = {}
+SERPER_CACHE_MAX_ENTRIES = 1024
+SERPER_CACHE_TTL = 600  # seconds
+
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Safari/605.1.15",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/18.19041",
     "Mozilla/5.0 (Windows NT 6.1; WOW64; Trident/7.0; AS; rv:11.0) like Gecko",
-]
+)
+USER_AGENT_COUNT = len(USER_AGENTS)
+
+# html2text options applied to every converter, set up once instead of per page
+HTML2TEXT_OPTIONS = {
+    "ignore_links": False,
+    "ignore_images": False,
+    "body_width": 0,  # No wrapping
+    "unicode_snob": True,  # Use Unicode instead of ASCII
+    "escape_snob": True,  # Don't escape special chars
+    "use_automatic_links": True,  # Auto-link URLs
+    "mark_code": True,  # Use markdown syntax for code blocks
+    "single_line_break": False,  # Use two line breaks to create a new paragraph
+    "table_border_style": "html",  # Use HTML table borders
+    "images_to_alt": False,  # Include image URLs
+    "protect_links": True,  # Don't convert links to references
+}
+
+# Tags rewritten before markdown conversion, visited in one find_all pass
+SPECIAL_TAGS = ["pre", "math", "script"]
+CODE_LANGUAGES = frozenset(
+    {
+        "python",
+        "javascript",
+        "css",
+        "html",
+        "java",
+        "php",
+        "c",
+        "cpp",
+        "csharp",
+        "ruby",
+        "go",
+    }
+)
+WHITESPACE_RE = re.compile(r"\s+")
+LANGUAGE_CLASS_RE = re.compile(r"^(?:language-|lang-)(.+)$")
+# Raw-text blocks readability throws away, dropped before it parses the page
+NON_CONTENT_BLOCK_RE = re.compile(
+    r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+MATH_SCRIPT_TYPES = frozenset(
+    {"math/tex", "math/tex; mode=display", "application/x-mathjax-config"}
+)
+
+
+async def fetch_content(url, headers, markdown=True):
+    cache_key = (url, markdown)
+    cached = PAGE_CACHE.get(cache_key)
+    response = await HTTP_CLIENT.get(
+        url, headers=with_conditional_headers(headers, cached)
+    )
+
+    # Page unchanged since we last rendered it, reuse the cached result
+    if cached and response.status_code == 304:
+        logging.info(f"Not modified, using cached content for [{url}]")
+        return cached[2]
+    response.raise_for_status()
+
+    # httpx decodes once using the declared charset, replacing invalid bytes
+    html_content = response.text
+
+    # Parsing and markdown conversion are CPU bound, keep them off the event loop
+    loop = asyncio.get_running_loop()
+    convert = convert_content if markdown else extract_content_tree
+    soup = await loop.run_in_executor(WORKER_POOL, convert, url, html_content)
+    remember_page(cache_key, response, soup)
+    return soup
+
+
+def with_conditional_headers(headers, cached):
+    """Add If-None-Match/If-Modified-Since validators for a cached page"""
+    if not cached:
+        return headers
+
+    etag, last_modified, _ = cached
+    conditional_headers = dict(headers)
+    if etag:
+        conditional_headers["If-None-Match"] = etag
+    if last_modified:
+        conditional_headers["If-Modified-Since"] = last_modified
+    return conditional_headers
+
+
+def remember_page(cache_key, response, soup):
+    """Cache a rendered page if the server sent validators we can revalidate with"""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    # Evict the oldest entry once the cache is full
+    if cache_key not in PAGE_CACHE and len(PAGE_CACHE) >= PAGE_CACHE_MAX_ENTRIES:
+        PAGE_CACHE.pop(next(iter(PAGE_CACHE)))
+    PAGE_CACHE[cache_key] = (etag, last_modified, soup)
 
 
-def fetch_content(url, headers):
-    response = requests.get(url, headers=headers)
-    html_content = response.content.decode(response.encoding or "utf-8")
-    doc = Document(html_content)
+def rewrite_code_block(pre):
+    """Wrap a <pre> in a markdown code fence when its language can be detected"""
+    # Handle code blocks better - ensure they have language tags when possible
+    classes = pre.code.get("class") if pre.code else None
+    if not classes:
+        return False
+
+    # Look for language classes like 'language-python', 'python', etc.
+    language = None
+    for cls in classes:
+        match = LANGUAGE_CLASS_RE.match(cls)
+        if match:
+            language = match.group(1)
+            break
+        if cls in CODE_LANGUAGES:
+            language = cls
+            break
+
+    if not language:
+        return False
+
+    # Wrap in markdown code fence with language
+    pre.insert_before(f"```{language}")
+    pre.insert_after("```")
+    return True
+
+
+def rewrite_math(element):
+    """Preserve LaTeX/MathJax and MathML markup in the markdown output"""
+    if element.name == "script" and element.get("type") in MATH_SCRIPT_TYPES:
+        # Preserve math content
+        element.replace_with(f"$$${element.string}$$$")
+        return True
+    if element.name == "math":
+        # Preserve MathML
+        element.replace_with(f"$$${str(element)}$$$")
+        return True
+    return False
+
+
+def strip_non_content(html_content):
+    """Drop script and style blocks so readability never builds them"""
+    return NON_CONTENT_BLOCK_RE.sub("", html_content)
+
+
+def convert_content(url, html_content):
+    doc = Document(strip_non_content(html_content))
     title = doc.title()
     summary_html = doc.summary(html_partial=True)
 
     # Pre-process HTML to handle special elements
-    soup = BeautifulSoup(summary_html, "html.parser")
+    soup = BeautifulSoup(summary_html, "lxml")
+    modified = False
 
-    # Handle code blocks better - ensure they have language tags when possible
-    for pre in soup.find_all("pre"):
-        if pre.code and pre.code.get("class"):
-            classes = pre.code.get("class")
-            # Look for language classes like 'language-python', 'python', etc.
-            language = None
-            for cls in classes:
-                if cls.startswith(("language-", "lang-")) or cls in [
-                    "python",
-                    "javascript",
-                    "css",
-                    "html",
-                    "java",
-                    "php",
-                    "c",
-                    "cpp",
-                    "csharp",
-                    "ruby",
-                    "go",
-                ]:
-                    language = cls.replace("language-", "").replace("lang-", "")
-                    break
-
-            if language:
-                # Wrap in markdown code fence with language
-                pre.insert_before(f"```{language}")
-                pre.insert_after("```")
-
-    # Handle LaTeX/MathJax by preserving the markup
-    for math in soup.find_all(["math", "script"]):
-        if math.name == "script" and math.get("type") in [
-            "math/tex",
-            "math/tex; mode=display",
-            "application/x-mathjax-config",
-        ]:
-            # Preserve math content
-            math.replace_with(f"$$${math.string}$$$")
-        elif math.name == "math":
-            # Preserve MathML
-            math.replace_with(f"$$${str(math)}$$$")
+    # Rewrite code blocks and math in a single traversal of the tree
+    for element in soup.find_all(SPECIAL_TAGS):
+        if element.name == "pre":
+            modified = rewrite_code_block(element) or modified
+        else:
+            modified = rewrite_math(element) or modified
 
     # Convert HTML to Markdown
-    h = html2text.HTML2Text()
-    h.ignore_links = False
-    h.ignore_images = False
-    h.body_width = 0  # No wrapping
-    h.unicode_snob = True  # Use Unicode instead of ASCII
-    h.escape_snob = True  # Don't escape special chars
-    h.use_automatic_links = True  # Auto-link URLs
-    h.mark_code = True  # Use markdown syntax for code blocks
-    h.single_line_break = False  # Use two line breaks to create a new paragraph
-    h.table_border_style = "html"  # Use HTML table borders
-    h.images_to_alt = False  # Include image URLs
-    h.protect_links = True  # Don't convert links to references
-
-    # Get the markdown content
-    markdown_content = h.handle(str(soup))
+    h = make_html2text()
+
+    # Get the markdown content, only re-serializing the tree if it was rewritten
+    markdown_content = h.handle(str(soup) if modified else summary_html)
 
     # Add title and metadata at the beginning
     full_markdown = f"# {title}\n\n*Source: {url}*\n\n{markdown_content}"
@@ -117,33 +241,87 @@ def fetch_content(url, headers):
     return soup
 
 
+def make_html2text():
+    """Create an HTML2Text converter with the shared options applied"""
+    # HTML2Text keeps parser state per document, so each conversion needs its own
+    h = html2text.HTML2Text()
+    for option, value in HTML2TEXT_OPTIONS.items():
+        setattr(h, option, value)
+    return h
+
+
+def random_user_agent():
+    """Pick a user agent to rotate between scrapes"""
+    return USER_AGENTS[random.randrange(USER_AGENT_COUNT)]
+
+
+def extract_content_tree(url, html_content):
+    """Parse only readability's content, skipping the markdown conversion"""
+    summary_html = Document(strip_non_content(html_content)).summary(html_partial=True)
+    return BeautifulSoup(summary_html, "lxml")
+
+
 def clean_text(text):
-    """Clean scraped text by normalizing whitespace and newlines"""
+    """Clean scraped text by collapsing all whitespace runs to single spaces"""
     if not text:
         return ""
-    # Replace multiple newlines with a single newline
-    text = "\n".join(line.strip() for line in text.splitlines() if line.strip())
-    # Replace multiple spaces with a single space
-    text = " ".join(text.split())
-    return text
+    return WHITESPACE_RE.sub(" ", text).strip()
 
 
-def try_fetch_with_backoff(url, headers, attempts=3, backoff_factor=2):
+def is_retryable(error):
+    """Check whether a failed fetch is transient and worth another attempt"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+async def try_fetch_with_backoff(
+    url, headers, attempts=3, backoff_factor=2, markdown=True
+):
     for attempt in range(attempts):
         try:
-            return fetch_content(url, headers)
+            return await fetch_content(url, headers, markdown=markdown)
         except Exception as e:
+            if not is_retryable(e):
+                logging.error(f"Not retrying [{url}]: {str(e)}")
+                raise
             if attempt < attempts - 1:  # No sleep after the last attempt
-                sleep_time = backoff_factor * attempt + random.uniform(0, 2)
+                # Exponential backoff with jitter so parallel retries spread out
+                sleep_time = min(
+                    BACKOFF_CAP, backoff_factor * 2**attempt
+                ) + random.uniform(0, BACKOFF_JITTER)
                 logging.warning(
                     f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {sleep_time:.2f} seconds..."
                 )
-                time.sleep(sleep_time)
+                await asyncio.sleep(sleep_time)
             else:
                 logging.error(f"All attempts failed: {str(e)}")
                 raise
 
 
+async def fetch_serper_results(query, api_key, gl="us", hl="en"):
+    """Fetch Serper search results, reusing recent responses for repeat queries"""
+    # The API key is part of the key so tenants never see each other's results
+    cache_key = (query, gl, hl, api_key)
+    cached = SERPER_CACHE.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        logging.info(f"Using cached Serper results for [{query}]")
+        return cached[1]
+
+    headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
+    payload = {"q": query, "gl": gl, "hl": hl}
+    response = await HTTP_CLIENT.post(SERPER_URL, headers=headers, json=payload)
+    response.raise_for_status()
+    search_results = response.json()
+
+    # Evict the oldest entry once the cache is full
+    SERPER_CACHE.pop(cache_key, None)
+    if len(SERPER_CACHE) >= SERPER_CACHE_MAX_ENTRIES:
+        SERPER_CACHE.pop(next(iter(SERPER_CACHE)))
+    SERPER_CACHE[cache_key] = (time.monotonic() + SERPER_CACHE_TTL, search_results)
+    return search_results
+
+
 def fetch_duckduckgo_search_results(query, max_results=3):
     """
     Fetches search results from DuckDuckGo as a free fallback.
@@ -185,8 +363,31 @@ def fetch_duckduckgo_search_results(query, max_results=3):
         return None
 
 
+def build_result_with_content(result, soup):
+    """Build a search result entry from a scraped page or the error it raised"""
+    url = result.get("link")
+
+    if isinstance(soup, Exception):
+        logging.error(f"Failed to scrape {url}: {str(soup)}")
+        content = f"Error: Failed to scrape content - {str(soup)}"
+    elif hasattr(soup, "markdown_content"):
+        # Use the markdown content if available
+        content = soup.markdown_content
+    else:
+        # Fallback to the old method
+        raw_content = soup.get_text(separator=" ").strip()
+        content = clean_text(raw_content)
+
+    return {
+        "title": result.get("title"),
+        "url": url,
+        "snippet": result.get("snippet"),
+        "content": content,
+    }
+
+
 @app.route(route="scrape", methods=["POST"], auth_level=func.AuthLevel.ANONYMOUS)
-def scrape(req: func.HttpRequest) -> func.HttpResponse:
+async def scrape(req: func.HttpRequest) -> func.HttpResponse:
     try:
         data = req.get_json()
         url = data.get("url")
@@ -196,9 +397,9 @@ def scrape(req: func.HttpRequest) -> func.HttpResponse:
 
         logging.info(f"scrape [{url}]")
 
-        headers = {"User-Agent": random.choice(USER_AGENTS)}
+        headers = {"User-Agent": random_user_agent()}
         try:
-            soup = try_fetch_with_backoff(url, headers)
+            soup = await try_fetch_with_backoff(url, headers)
         except Exception as e:
             logging.error(f"Requests failed: {str(e)}")
             return func.HttpResponse(
@@ -223,7 +424,7 @@ def scrape(req: func.HttpRequest) -> func.HttpResponse:
 @app.route(
     route="scrape_with_images", methods=["POST"], auth_level=func.AuthLevel.ANONYMOUS
 )
-def scrape_with_images(req: func.HttpRequest) -> func.HttpResponse:
+async def scrape_with_images(req: func.HttpRequest) -> func.HttpResponse:
     try:
         data = req.get_json()
         url = data.get("url")
@@ -233,34 +434,25 @@ def scrape_with_images(req: func.HttpRequest) -> func.HttpResponse:
 
         logging.info(f"scraping_with_images [{url}]")
 
-        headers = {"User-Agent": random.choice(USER_AGENTS)}
+        headers = {"User-Agent": random_user_agent()}
         try:
-            soup = try_fetch_with_backoff(url, headers)
+            soup = await try_fetch_with_backoff(url, headers, markdown=False)
         except Exception as e:
             logging.error(f"Requests failed: {str(e)}")
             return func.HttpResponse(
                 f"Error: Failed to scrape the URL - {str(e)}", status_code=500
             )
 
-        text_parts = []
-        images = []
+        # Extract text and images separately, letting BeautifulSoup walk the tree
+        text_content = clean_text(soup.get_text(separator=" ", strip=True))
+        images = [
+            img["src"]
+            for img in soup.find_all("img", src=True)
+            if img["src"].startswith(("http://", "https://"))
+        ]
 
-        # Extract text and images separately
-        for element in soup.descendants:
-            if isinstance(element, str) and element.strip():
-                text_parts.append(element.strip())
-            elif element.name == "img":
-                img_url = element.get("src")
-                if img_url and img_url.startswith(("http://", "https://")):
-                    images.append(img_url)
-
-        # Clean and join text
-        text_content = clean_text(" ".join(text_parts))
-
-        # Add images after the text
-        content = text_content
-        for img_url in images:
-            content += f"\n\n{img_url}"
+        # Add images after the text in a single join
+        content = "\n\n".join([text_content, *images])
 
         response_data = {"content": content}
 
@@ -275,7 +467,7 @@ def scrape_with_images(req: func.HttpRequest) -> func.HttpResponse:
 
 
 @app.route(route="search", methods=["POST"], auth_level=func.AuthLevel.ANONYMOUS)
-def search(req: func.HttpRequest) -> func.HttpResponse:
+async def search(req: func.HttpRequest) -> func.HttpResponse:
     try:
         data = req.get_json()
         query = data.get("query")
@@ -298,12 +490,7 @@ def search(req: func.HttpRequest) -> func.HttpResponse:
                 search_source = "Serper API"
 
                 # Call Serper.dev API to get search results
-                serper_url = "https://google.serper.dev/search"
-                headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
-                payload = {"q": query, "gl": "us", "hl": "en"}
-
-                response = requests.post(serper_url, headers=headers, json=payload)
-                search_results = response.json()
+                search_results = await fetch_serper_results(query, api_key)
 
                 # Extract top 3 organic results
                 if "organic" in search_results and search_results["organic"]:
@@ -324,7 +511,9 @@ def search(req: func.HttpRequest) -> func.HttpResponse:
                 )
 
             search_source = "DuckDuckGo (free fallback)"
-            duckduckgo_results = fetch_duckduckgo_search_results(query)
+            duckduckgo_results = await asyncio.get_running_loop().run_in_executor(
+                WORKER_POOL, fetch_duckduckgo_search_results, query
+            )
 
             if duckduckgo_results:
                 top_results = duckduckgo_results
@@ -341,47 +530,19 @@ def search(req: func.HttpRequest) -> func.HttpResponse:
                     mimetype="application/json",
                     status_code=404,
                 )
-        results_with_content = []
+        headers = {"User-Agent": random_user_agent()}
 
-        user_agent = random.choice(USER_AGENTS)
-        headers = {"User-Agent": user_agent}
-
-        # Scrape content for each result
-        for result in top_results:
-            url = result.get("link")
-            if not url:
-                continue
+        # Scrape all results concurrently instead of one round-trip at a time
+        top_results = [result for result in top_results if result.get("link")]
+        soups = await asyncio.gather(
+            *[try_fetch_with_backoff(r["link"], headers) for r in top_results],
+            return_exceptions=True,
+        )
 
-            try:
-                # Use the existing scrape functionality
-                soup = try_fetch_with_backoff(url, headers)
-
-                # Use the markdown content if available
-                if hasattr(soup, "markdown_content"):
-                    content = soup.markdown_content
-                else:
-                    # Fallback to the old method
-                    raw_content = soup.get_text(separator=" ").strip()
-                    content = clean_text(raw_content)
-
-                results_with_content.append(
-                    {
-                        "title": result.get("title"),
-                        "url": url,
-                        "snippet": result.get("snippet"),
-                        "content": content,
-                    }
-                )
-            except Exception as e:
-                logging.error(f"Failed to scrape {url}: {str(e)}")
-                results_with_content.append(
-                    {
-                        "title": result.get("title"),
-                        "url": url,
-                        "snippet": result.get("snippet"),
-                        "content": f"Error: Failed to scrape content - {str(e)}",
-                    }
-                )
+        results_with_content = [
+            build_result_with_content(result, soup)
+            for result, soup in zip(top_results, soups)
+        ]
 
         # Include the query, search source, and result count in the response
         return func.HttpResponse(
@@ -3,12 +3,15 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import asyncio
 import json
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from bs4 import BeautifulSoup
 
 import function_app
 
@@ -34,14 +37,25 @@ def mock_http_request():
     return MockHttpRequest
 
 
-@patch("function_app.requests.get")
+@pytest.fixture(autouse=True)
+def clear_page_cache():
+    """Start every test with empty page and Serper caches."""
+    function_app.PAGE_CACHE.clear()
+    function_app.SERPER_CACHE.clear()
+    yield
+    function_app.PAGE_CACHE.clear()
+    function_app.SERPER_CACHE.clear()
+
+
+@patch("function_app.HTTP_CLIENT.get", new_callable=AsyncMock)
 @patch("function_app.Document")
 def test_fetch_content(mock_document, mock_get, mock_http_request):
     """Test the fetch_content function."""
     # Set up the mock response
     mock_response = MagicMock()
-    mock_response.content = b"<html><head><title>Test Page</title></head><body><article><p>Test content</p></article></body></html>"
-    mock_response.encoding = "utf-8"
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.text = "<html><head><title>Test Page</title></head><body><article><p>Test content</p></article></body></html>"
     mock_get.return_value = mock_response
 
     # Setup mock Document instance
@@ -57,7 +71,9 @@ def test_fetch_content(mock_document, mock_get, mock_http_request):
     function_app.html2text.HTML2Text = MagicMock(return_value=mock_h)
 
     # Call the function
-    soup = function_app.fetch_content("https://example.com", {"User-Agent": "test"})
+    soup = asyncio.run(
+        function_app.fetch_content("https://example.com", {"User-Agent": "test"})
+    )
 
     # Check the result
     assert hasattr(soup, "markdown_content")
@@ -69,7 +85,31 @@ def test_fetch_content(mock_document, mock_get, mock_http_request):
     )
 
 
-@patch("function_app.try_fetch_with_backoff")
+@patch("function_app.HTTP_CLIENT.get", new_callable=AsyncMock)
+def test_fetch_content_reuses_cached_page_when_not_modified(mock_get):
+    """Test that a 304 response returns the cached page without re-parsing."""
+    cached_soup = MagicMock()
+    function_app.PAGE_CACHE[("https://example.com", True)] = (
+        '"abc123"',
+        "Wed, 21 Oct 2015 07:28:00 GMT",
+        cached_soup,
+    )
+    mock_response = MagicMock()
+    mock_response.status_code = 304
+    mock_get.return_value = mock_response
+
+    soup = asyncio.run(
+        function_app.fetch_content("https://example.com", {"User-Agent": "test"})
+    )
+
+    assert soup is cached_soup
+    sent_headers = mock_get.call_args[1]["headers"]
+    assert sent_headers["If-None-Match"] == '"abc123"'
+    assert sent_headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert sent_headers["User-Agent"] == "test"
+
+
+@patch("function_app.try_fetch_with_backoff", new_callable=AsyncMock)
 def test_scrape(mock_fetch, mock_http_request):
     """Test the scrape function."""
     # Set up the mock
@@ -84,7 +124,7 @@ def test_scrape(mock_fetch, mock_http_request):
     request = mock_http_request(body='{"url": "https://example.com"}')
 
     # Call the function
-    response = function_app.scrape(request)
+    response = asyncio.run(function_app.scrape(request))
 
     # Check the response
     assert response.status_code == 200
@@ -95,14 +135,14 @@ def test_scrape(mock_fetch, mock_http_request):
     mock_fetch.assert_called_once()
 
 
-@patch("function_app.try_fetch_with_backoff")
+@patch("function_app.try_fetch_with_backoff", new_callable=AsyncMock)
 def test_scrape_missing_url(mock_fetch, mock_http_request):
     """Test the scrape function with missing URL."""
     # Create a mock request with no URL
     request = mock_http_request(body="{}")
 
     # Call the function
-    response = function_app.scrape(request)
+    response = asyncio.run(function_app.scrape(request))
 
     # Check the response
     assert response.status_code == 400
@@ -110,8 +150,8 @@ def test_scrape_missing_url(mock_fetch, mock_http_request):
     mock_fetch.assert_not_called()
 
 
-@patch("function_app.requests.post")
-@patch("function_app.try_fetch_with_backoff")
+@patch("function_app.HTTP_CLIENT.post", new_callable=AsyncMock)
+@patch("function_app.try_fetch_with_backoff", new_callable=AsyncMock)
 def test_search(mock_fetch, mock_post, mock_http_request):
     """Test the search function."""
     # Set up the mocks
@@ -154,7 +194,7 @@ def test_search(mock_fetch, mock_post, mock_http_request):
     request = mock_http_request(body='{"query": "test query"}')
 
     # Call the function
-    response = function_app.search(request)
+    response = asyncio.run(function_app.search(request))
 
     # Check the response
     assert response.status_code == 200
@@ -172,34 +212,54 @@ def test_search(mock_fetch, mock_post, mock_http_request):
     assert mock_post.call_args[1]["json"]["q"] == "test query"
 
 
-@patch("function_app.try_fetch_with_backoff")
-def test_scrape_with_images(mock_fetch, mock_http_request):
-    """Test the scrape_with_images function."""
-    # Set up the mock BeautifulSoup object
-    mock_soup = MagicMock()
+@patch("function_app.HTTP_CLIENT.post", new_callable=AsyncMock)
+def test_fetch_serper_results_reuses_cached_response(mock_post):
+    """Test that repeat queries are answered from the cache per API key."""
+    mock_post.return_value.json = MagicMock(return_value={"organic": []})
+    mock_post.return_value.raise_for_status = MagicMock()
+
+    first = asyncio.run(function_app.fetch_serper_results("query", "key-a"))
+    second = asyncio.run(function_app.fetch_serper_results("query", "key-a"))
+    asyncio.run(function_app.fetch_serper_results("query", "key-b"))
+
+    assert first is second
+    assert mock_post.call_count == 2
+
+
+@patch("function_app.time.monotonic")
+@patch("function_app.HTTP_CLIENT.post", new_callable=AsyncMock)
+def test_fetch_serper_results_refetches_after_ttl(mock_post, mock_monotonic):
+    """Test that expired Serper responses are fetched again."""
+    mock_post.return_value.json = MagicMock(return_value={"organic": []})
+    mock_post.return_value.raise_for_status = MagicMock()
+    mock_monotonic.return_value = 1000.0
 
-    # Create text nodes and img elements to simulate traversing the soup
-    text_node1 = "This is text part 1"
-    text_node2 = "This is text part 2"
+    asyncio.run(function_app.fetch_serper_results("query", "key"))
+    mock_monotonic.return_value += function_app.SERPER_CACHE_TTL + 1
+    asyncio.run(function_app.fetch_serper_results("query", "key"))
 
-    # Create mock img tags with src attributes
-    img1 = MagicMock()
-    img1.name = "img"
-    img1.get.return_value = "https://example.com/image1.jpg"
+    assert mock_post.call_count == 2
 
-    img2 = MagicMock()
-    img2.name = "img"
-    img2.get.return_value = "https://example.com/image2.jpg"
 
-    # Set up the descendants to be iterated over
-    mock_soup.descendants = [text_node1, img1, text_node2, img2]
+@patch("function_app.try_fetch_with_backoff", new_callable=AsyncMock)
+def test_scrape_with_images(mock_fetch, mock_http_request):
+    """Test the scrape_with_images function."""
+    # Set up a parsed content tree with text, absolute and relative images
+    mock_soup = BeautifulSoup(
+        "<div><p>This is text part 1</p>"
+        '<img src="https://example.com/image1.jpg">'
+        "<p>This is text part 2</p>"
+        '<img src="https://example.com/image2.jpg">'
+        '<img src="/relative.jpg"></div>',
+        "lxml",
+    )
     mock_fetch.return_value = mock_soup
 
     # Create a mock request
     request = mock_http_request(body='{"url": "https://example.com"}')
 
     # Call the function
-    response = function_app.scrape_with_images(request)
+    response = asyncio.run(function_app.scrape_with_images(request))
 
     # Check the response
     assert response.status_code == 200
@@ -210,6 +270,216 @@ def test_scrape_with_images(mock_fetch, mock_http_request):
     assert "This is text part 2" in response_body["content"]
     assert "https://example.com/image1.jpg" in response_body["content"]
     assert "https://example.com/image2.jpg" in response_body["content"]
+    assert "/relative.jpg" not in response_body["content"]
 
     # Verify that the fetch function was called
     mock_fetch.assert_called_once()
+
+
+@patch("function_app.HTTP_CLIENT.post", new_callable=AsyncMock)
+@patch("function_app.try_fetch_with_backoff", new_callable=AsyncMock)
+def test_search_isolates_failed_scrapes(mock_fetch, mock_post, mock_http_request):
+    """Test that one failed scrape does not fail the other results."""
+    function_app.SERPER_API_KEY = "test_api_key"  # pragma: allowlist secret
+
+    mock_serper_response = MagicMock()
+    mock_serper_response.json.return_value = {
+        "organic": [
+            {"title": "Broken", "link": "https://example.com/1", "snippet": "s1"},
+            {"title": "Working", "link": "https://example.com/2", "snippet": "s2"},
+        ]
+    }
+    mock_post.return_value = mock_serper_response
+
+    mock_soup = MagicMock()
+    mock_soup.markdown_content = "# Working\n\nMarkdown content 2"
+    mock_fetch.side_effect = [Exception("Connection reset"), mock_soup]
+
+    request = mock_http_request(body='{"query": "test query"}')
+    response = asyncio.run(function_app.search(request))
+
+    assert response.status_code == 200
+    response_body = json.loads(response.get_body().decode())
+    assert response_body["result_count"] == 2
+    assert "Connection reset" in response_body["results"][0]["content"]
+    assert "Markdown content 2" in response_body["results"][1]["content"]
+
+
+def http_status_error(status_code):
+    """Build the error httpx raises for a response with the given status."""
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("status", request=request, response=response)
+
+
+@patch("function_app.asyncio.sleep", new_callable=AsyncMock)
+@patch("function_app.fetch_content", new_callable=AsyncMock)
+def test_try_fetch_with_backoff_fails_fast_on_client_errors(mock_fetch, mock_sleep):
+    """Test that permanent failures such as 404 are not retried."""
+    mock_fetch.side_effect = http_status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(function_app.try_fetch_with_backoff("https://example.com", {}))
+
+    mock_fetch.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@patch("function_app.random.uniform", return_value=0.5)
+@patch("function_app.asyncio.sleep", new_callable=AsyncMock)
+@patch("function_app.fetch_content", new_callable=AsyncMock)
+def test_try_fetch_with_backoff_retries_transient_errors(
+    mock_fetch, mock_sleep, mock_uniform
+):
+    """Test exponential backoff on timeouts and retryable status codes."""
+    soup = MagicMock()
+    mock_fetch.side_effect = [
+        httpx.ConnectTimeout("timed out"),
+        http_status_error(503),
+        soup,
+    ]
+
+    result = asyncio.run(function_app.try_fetch_with_backoff("https://example.com", {}))
+
+    assert result is soup
+    assert mock_fetch.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2.5, 4.5]
+
+
+def test_convert_content_skips_reserialization_without_rewrites():
+    """Test that untouched readability output goes straight to html2text."""
+    mock_h = MagicMock()
+    mock_h.handle.return_value = "Plain article"
+    html = "<html><head><title>T</title></head><body><p>Plain article</p></body></html>"
+
+    with (
+        patch("function_app.html2text.HTML2Text", return_value=mock_h),
+        patch("function_app.Document") as mock_document,
+    ):
+        mock_document.return_value.title.return_value = "T"
+        mock_document.return_value.summary.return_value = "<p>Plain article</p>"
+        soup = function_app.convert_content("https://example.com", html)
+
+    mock_h.handle.assert_called_once_with("<p>Plain article</p>")
+    assert "Plain article" in soup.markdown_content
+
+
+def test_convert_content_rewrites_code_and_math_in_one_pass():
+    """Test that code fences and math markup are rewritten before conversion."""
+    mock_h = MagicMock()
+    mock_h.handle.return_value = "converted"
+    summary = (
+        '<div><pre><code class="language-python">print(1)</code></pre>'
+        '<script type="math/tex">x^2</script></div>'
+    )
+
+    with (
+        patch("function_app.html2text.HTML2Text", return_value=mock_h),
+        patch("function_app.Document") as mock_document,
+    ):
+        mock_document.return_value.title.return_value = "T"
+        mock_document.return_value.summary.return_value = summary
+        function_app.convert_content("https://example.com", "<html></html>")
+
+    converted_html = mock_h.handle.call_args[0][0]
+    assert "```python" in converted_html
+    assert "$$$x^2$$$" in converted_html
+    assert "<script" not in converted_html
+
+
+def test_extract_content_tree_skips_markdown_conversion():
+    """Test that image scraping parses readability output without html2text."""
+    html = (
+        "<html><head><title>T</title></head><body><article>"
+        "<p>Some article text that readability should keep around.</p>"
+        '<img src="https://example.com/a.jpg"></article></body></html>'
+    )
+
+    with patch("function_app.html2text.HTML2Text") as mock_html2text:
+        soup = function_app.extract_content_tree("https://example.com", html)
+
+    mock_html2text.assert_not_called()
+    assert soup.find("img")["src"] == "https://example.com/a.jpg"
+
+
+def test_strip_non_content_drops_script_and_style_blocks():
+    """Test that raw-text blocks are removed before readability parses the page."""
+    html = (
+        "<p>Keep me</p><SCRIPT type='text/javascript'>var s = '<b>';</SCRIPT >"
+        "<style>p { color: red; }</style><noscript><img src='x'></noscript>"
+        "<p>And me</p>"
+    )
+
+    with patch("function_app.Document") as mock_document:
+        mock_document.return_value.summary.return_value = "<p>Keep me</p>"
+        function_app.extract_content_tree("https://example.com", html)
+
+    mock_document.assert_called_once_with(
+        "<p>Keep me</p><noscript><img src='x'></noscript><p>And me</p>"
+    )
+
+
+def test_strip_non_content_keeps_noscript_images():
+    """Test that lazy-loaded images wrapped in noscript reach readability."""
+    html = (
+        '<article><img class="lazy" data-src="https://example.com/photo.jpg">'
+        '<noscript><img src="https://example.com/photo.jpg"></noscript>'
+        "<script>lazyLoad();</script></article>"
+    )
+
+    stripped = function_app.strip_non_content(html)
+
+    assert '<noscript><img src="https://example.com/photo.jpg"></noscript>' in stripped
+    assert "lazyLoad" not in stripped
+
+
+def test_make_html2text_applies_shared_options():
+    """Test that each converter gets the module-level html2text options."""
+    with patch(
+        "function_app.html2text.HTML2Text", side_effect=[MagicMock(), MagicMock()]
+    ):
+        first = function_app.make_html2text()
+        second = function_app.make_html2text()
+
+    assert first.body_width == 0
+    assert first.protect_links is True
+    assert first.table_border_style == "html"
+    assert first is not second
+    assert second.mark_code is True
+
+
+def test_random_user_agent_picks_from_pool():
+    """Test that rotated user agents always come from the configured pool."""
+    for _ in range(20):
+        assert function_app.random_user_agent() in function_app.USER_AGENTS
+
+
+@pytest.mark.parametrize(
+    "css_class, expected_fence",
+    [("language-python", "```python"), ("lang-ruby", "```ruby"), ("go", "```go")],
+)
+def test_rewrite_code_block_detects_language(css_class, expected_fence):
+    """Test language detection from prefixed and bare code classes."""
+    soup = BeautifulSoup(
+        f'<pre><code class="{css_class}">x = 1</code></pre>', "html.parser"
+    )
+
+    assert function_app.rewrite_code_block(soup.pre)
+    assert str(soup).startswith(expected_fence)
+
+
+def test_rewrite_code_block_ignores_unknown_classes():
+    """Test that code blocks without a language class are left untouched."""
+    soup = BeautifulSoup('<pre><code class="hljs">x = 1</code></pre>', "html.parser")
+
+    assert not function_app.rewrite_code_block(soup.pre)
+    assert "```" not in str(soup)
+
+
+def test_clean_text_collapses_whitespace():
+    """Test that newlines, tabs and repeated spaces collapse to single spaces."""
+    text = "  First line  \n\n\n  second\tline \r\n   third   "
+
+    assert function_app.clean_text(text) == "First line second line third"
+    assert function_app.clean_text("") == ""
+    assert function_app.clean_text(None) == ""
@@ -6,17 +6,30 @@
 """API tools module for FastMCP WebCat integration.
 
 DEPRECATED: Import from tools.api_tools_setup instead.
-This module provides backward compatibility for existing imports.
+This module provides backward compatibility for existing imports. The real
+implementations are loaded on first attribute access so importing this
+module alone does not pull in FastMCP and the tool stack.
 """
 
 import warnings
 
-from tools.api_tools_setup import create_webcat_functions, setup_webcat_tools
+__all__ = ["setup_webcat_tools", "create_webcat_functions"]  # noqa: F822
 
-warnings.warn(
-    "Importing from 'api_tools' is deprecated. Use 'tools.api_tools_setup' instead.",
-    DeprecationWarning,
-    stacklevel=2,
-)
 
-__all__ = ["setup_webcat_tools", "create_webcat_functions"]
+def __getattr__(name: str):
+    """Lazily re-export names from tools.api_tools_setup (PEP 562)."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    warnings.warn(
+        "Importing from 'api_tools' is deprecated. Use 'tools.api_tools_setup' instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
+    from tools import api_tools_setup
+
+    # Cache on the module so later lookups skip __getattr__ and the warning
+    for exported in __all__:
+        globals()[exported] = getattr(api_tools_setup, exported)
+    return globals()[name]
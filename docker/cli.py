@@ -74,6 +74,9 @@ def main():
             pass
 
             from mcp_server import mcp_server
+            from utils.event_loop import install_uvloop
+
+            install_uvloop()
 
             print(f"📡 WebCat MCP Server: http://{args.host}:{args.port}/mcp")
             print("✨ Ready for MCP connections!")
@@ -8,7 +8,7 @@
 import logging
 from typing import List
 
-from models.api_search_result import APISearchResult
+from models.domain.api_search_result import APISearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -56,14 +56,14 @@ def fetch_duckduckgo_search_results(
         return []
 
     try:
-        logger.info(f"Using DuckDuckGo fallback search for: {query}")
+        logger.info("Using DuckDuckGo fallback search for: %s", query)
 
         with DDGS() as ddgs:
             search_results = ddgs.text(query, max_results=max_results)
             results = [_convert_ddg_result(result) for result in search_results]
-            logger.info(f"DuckDuckGo returned {len(results)} results")
+            logger.info("DuckDuckGo returned %d results", len(results))
             return results
 
     except Exception as e:
-        logger.error(f"Error fetching DuckDuckGo search results: {str(e)}")
+        logger.error("Error fetching DuckDuckGo search results: %s", e)
         return []
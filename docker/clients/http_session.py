@@ -0,0 +1,23 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Shared HTTP clients - pool connections across search and scrape requests."""
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# Sized for both worker pools hitting upstreams at once; retries are handled
+# (or deliberately not) by the callers, so the adapter never retries itself
+HTTP_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+HTTP_SESSION.mount("https://", _adapter)
+HTTP_SESSION.mount("http://", _adapter)
+
+# Async client for upstream APIs called directly from the event loop
+ASYNC_HTTP_CLIENT = httpx.AsyncClient(
+    timeout=httpx.Timeout(5.0, connect=2.0),
+    limits=httpx.Limits(max_connections=128),
+)
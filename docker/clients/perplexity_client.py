@@ -6,21 +6,77 @@
 """Perplexity API client - deep research search using Perplexity's sonar models."""
 
 import logging
-from typing import List, Literal
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, List, Literal
 
-from perplexity import Perplexity
+from constants import (
+    PERPLEXITY_CLIENT_CACHE_MAX_ENTRIES,
+    PERPLEXITY_CLIENT_CACHE_TTL_SECONDS,
+)
+from utils.ttl_cache import TTLCache
+
+# The SDK takes the better part of a second to import, so it is only loaded
+# once deep research is actually used
+if TYPE_CHECKING:
+    from perplexity import AsyncPerplexity
 
 logger = logging.getLogger(__name__)
 
+# One client per API key so keep-alive connections are reused across calls;
+# bounded because the key comes from the caller
+PERPLEXITY_CLIENTS = TTLCache(
+    PERPLEXITY_CLIENT_CACHE_MAX_ENTRIES, PERPLEXITY_CLIENT_CACHE_TTL_SECONDS
+)
+
+
+RESEARCH_SYSTEM_PROMPT = (
+    "You are a comprehensive research assistant. Provide detailed, "
+    "well-researched answers with clear structure and citations. "
+    "Focus on returning {max_results} most relevant sources."
+)
+
+
+def research_system_message(max_results: int) -> Dict[str, str]:
+    """Build the deep research system message from the module-level template.
+
+    Args:
+        max_results: Number of sources the model should focus on
+
+    Returns:
+        Chat message dict with the system role
+    """
+    return {
+        "role": "system",
+        "content": RESEARCH_SYSTEM_PROMPT.format(max_results=max_results),
+    }
+
+
+def get_perplexity_client(api_key: str) -> "AsyncPerplexity":
+    """Return the shared Perplexity client for an API key, creating it once.
+
+    Args:
+        api_key: Perplexity API key
+
+    Returns:
+        AsyncPerplexity client with a 10-minute timeout for deep research
+    """
+    client = PERPLEXITY_CLIENTS.get(api_key)
+    if client is None:
+        from perplexity import AsyncPerplexity
+
+        client = AsyncPerplexity(api_key=api_key, timeout=600.0)
+        PERPLEXITY_CLIENTS.set(api_key, client)
+    return client
+
 
-def fetch_perplexity_deep_research(
+async def fetch_perplexity_deep_research(
     query: str,
     api_key: str,
     max_results: int = 5,
     research_effort: Literal["low", "medium", "high"] = "high",
 ) -> tuple[str, List[str]]:
     """
-    Fetch deep research results from Perplexity AI using official SDK.
+    Fetch deep research results from Perplexity AI using the official async SDK.
 
     Uses Perplexity's sonar-deep-research model which performs dozens of searches,
     reads hundreds of sources, and reasons through material to deliver comprehensive
@@ -40,25 +96,19 @@ def fetch_perplexity_deep_research(
     """
     try:
         logger.info(
-            f"Fetching Perplexity deep research (effort: {research_effort}): {query}"
+            "Fetching Perplexity deep research (effort: %s): %s",
+            research_effort,
+            query,
         )
 
-        # Initialize Perplexity client with 10-minute timeout for deep research
-        client = Perplexity(api_key=api_key, timeout=600.0)
+        client = get_perplexity_client(api_key)
 
         # Create chat completion with deep research
         # Note: Official SDK may not support all parameters, using minimal set
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="sonar-deep-research",
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a comprehensive research assistant. Provide detailed, "
-                        "well-researched answers with clear structure and citations. "
-                        f"Focus on returning {max_results} most relevant sources."
-                    ),
-                },
+                research_system_message(max_results),
                 {"role": "user", "content": query},
             ],
         )
@@ -72,22 +122,27 @@ def fetch_perplexity_deep_research(
 
             # Extract citations from response
             if hasattr(response, "citations") and response.citations:
-                citation_urls = [
+                # Deep research can cite dozens of sources; stop once we have enough
+                urls = (
                     citation if isinstance(citation, str) else citation.get("url", "")
                     for citation in response.citations
                     if citation
-                ][:max_results]
+                )
+                citation_urls = list(islice(filter(None, urls), max_results))
 
             token_count = (
                 response.usage.total_tokens if hasattr(response, "usage") else "N/A"
             )
             logger.info(
-                f"Perplexity deep research completed: {len(research_report)} chars, "
-                f"{len(citation_urls)} citations, {token_count} tokens"
+                "Perplexity deep research completed: %d chars, %d citations, "
+                "%s tokens",
+                len(research_report),
+                len(citation_urls),
+                token_count,
             )
 
         return research_report, citation_urls
 
     except Exception as e:
-        logger.exception(f"Error fetching Perplexity deep research: {str(e)}")
+        logger.exception("Error fetching Perplexity deep research: %s", e)
         return "", []
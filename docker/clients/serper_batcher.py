@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Serper batcher - groups concurrent searches into batched Serper requests."""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from clients.serper_client import afetch_search_results_batch
+from models.domain.api_search_result import APISearchResult
+
+logger = logging.getLogger(__name__)
+
+PendingSearch = Tuple[str, int, "asyncio.Future[List[APISearchResult]]"]
+
+
+class SerperBatcher:
+    """Collects searches for a short window and sends them as one request.
+
+    Searches are grouped per API key. A batch is sent when the window closes
+    or as soon as it reaches ``max_batch_size`` queries, whichever is first.
+    """
+
+    def __init__(self, window_seconds: float, max_batch_size: int = 10):
+        """Create an empty batcher.
+
+        Args:
+            window_seconds: How long to wait for more queries before sending
+            max_batch_size: Queries per batch that trigger an immediate send
+        """
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, List[PendingSearch]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        # Strong references so in-flight sends aren't garbage-collected
+        self._sends: Set["asyncio.Task[None]"] = set()
+
+    async def search(
+        self, query: str, api_key: str, max_results: int = 5
+    ) -> List[APISearchResult]:
+        """Queue a search and wait for its share of the batched response.
+
+        Args:
+            query: The search query
+            api_key: The Serper API key
+            max_results: Maximum number of results to return
+
+        Returns:
+            A list of APISearchResult objects
+
+        Raises:
+            Exception: If the batched request failed
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[List[APISearchResult]]" = loop.create_future()
+        batch = self._pending.setdefault(api_key, [])
+        batch.append((query, max_results, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(api_key)
+        elif api_key not in self._timers:
+            self._timers[api_key] = loop.call_later(
+                self.window_seconds, self._flush, api_key
+            )
+
+        # Shield so a caller timing out doesn't cancel the batch for everyone
+        return await asyncio.shield(future)
+
+    def _flush(self, api_key: str) -> None:
+        """Send every pending search for an API key as one batch."""
+        timer: Optional[asyncio.TimerHandle] = self._timers.pop(api_key, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(api_key, [])
+        if batch:
+            task = asyncio.ensure_future(self._send(batch, api_key))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+
+    async def _send(self, batch: List[PendingSearch], api_key: str) -> None:
+        """Run one batched request and resolve each waiting search."""
+        logger.info("Sending %d batched Serper searches", len(batch))
+        queries = [(query, max_results) for query, max_results, _ in batch]
+        try:
+            results = await afetch_search_results_batch(queries, api_key)
+        except Exception as e:
+            # Fail every search so callers can tell an outage from no hits
+            logger.error("Batched Serper search failed: %s", e)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), query_results in zip(batch, results):
+            if not future.done():
+                future.set_result(query_results)
+        # Never leave a caller waiting on a search the response didn't cover
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result([])
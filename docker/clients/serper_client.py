@@ -7,14 +7,42 @@
 
 import json
 import logging
-from typing import List, Optional
+import re
+from typing import Any, List, Optional, Tuple
 
+import httpx
 import requests
 
-from models.api_search_result import APISearchResult
+from clients.http_session import ASYNC_HTTP_CLIENT, HTTP_SESSION
+from constants import (
+    MAX_CONTENT_LENGTH,
+    SCRAPE_CACHE_MAX_ENTRIES,
+    SCRAPE_CACHE_TTL_SECONDS,
+    SERPER_ATTEMPT_TIMEOUT_SECONDS,
+    SERPER_ATTEMPTS,
+)
+from models.domain.api_search_result import APISearchResult
+from utils.retry import retry_async
+from utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+SERPER_SEARCH_URL = "https://google.serper.dev/search"
+
+# Scrape bodies wrap the page text in JSON alongside metadata and JSON-LD,
+# so allow headroom over the text limit before giving up on a download
+SCRAPE_MAX_RESPONSE_BYTES = 4 * MAX_CONTENT_LENGTH
+
+# Start of the page text value in a scrape response; quotes inside JSON
+# strings are escaped, so this cannot match within another field's value
+_TEXT_FIELD = re.compile(r'"text"\s*:\s*"')
+
+# Rate limiting and server-side failures are worth retrying; other 4xx are not
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Blocking scrapes run on worker threads; only successful responses are cached
+SCRAPED_PAGES_CACHE = TTLCache(SCRAPE_CACHE_MAX_ENTRIES, SCRAPE_CACHE_TTL_SECONDS)
+
 
 def _convert_organic_results(organic_results: list) -> List[APISearchResult]:
     """Convert organic search results to APISearchResult objects.
@@ -35,11 +63,117 @@ def _convert_organic_results(organic_results: list) -> List[APISearchResult]:
     ]
 
 
-def fetch_search_results(
+def _parse_search_response(data: dict, max_results: int) -> List[APISearchResult]:
+    """Extract organic results from a Serper search response.
+
+    Args:
+        data: Parsed JSON body from the Serper search API
+        max_results: Maximum number of results to return
+
+    Returns:
+        List of APISearchResult objects
+    """
+    if "organic" in data:
+        # Only build the results we keep
+        return _convert_organic_results(data["organic"][:max_results])
+    return []
+
+
+def _read_capped(response: requests.Response, limit: int) -> Tuple[bytes, bool]:
+    """Read a streamed response body, stopping once it grows past a limit.
+
+    Args:
+        response: Response opened with stream=True
+        limit: Maximum number of bytes to accept
+
+    Returns:
+        Tuple of (body read so far, whether reading stopped at the limit)
+    """
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=65536):
+        body += chunk
+        if len(body) > limit:
+            return bytes(body), True
+    return bytes(body), False
+
+
+def _text_from_prefix(body: bytes) -> str:
+    """Recover the page text from the start of a truncated scrape response.
+
+    Args:
+        body: Leading bytes of a Serper scrape JSON response
+
+    Returns:
+        The text value, cut short where the body ends, or "" if not found
+    """
+    document = body.decode("utf-8", errors="ignore")
+    match = _TEXT_FIELD.search(document)
+    if match is None:
+        return ""
+
+    try:
+        # The text may be complete, with only later fields cut off
+        return json.decoder.scanstring(document, match.end())[0]
+    except ValueError:
+        pass
+
+    # Drop an escape sequence split by the cut (\uXXXX is the longest)
+    fragment = document[match.end() :]
+    for end in range(len(fragment), max(len(fragment) - 6, 0) - 1, -1):
+        try:
+            return json.loads(f'"{fragment[:end]}"')
+        except ValueError:
+            continue
+    return ""
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether a failed Serper request is worth retrying.
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        True for timeouts, connection errors and retryable status codes
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.TimeoutException, httpx.NetworkError))
+
+
+async def _apost_search(payload: Any, api_key: str) -> Any:
+    """POST a search payload to Serper, retrying transient failures.
+
+    Args:
+        payload: Single query object or list of query objects
+        api_key: The Serper API key
+
+    Returns:
+        Parsed JSON response body
+
+    Raises:
+        Exception: If the request still fails after retrying
+    """
+    headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
+
+    async def post() -> Any:
+        response = await ASYNC_HTTP_CLIENT.post(
+            SERPER_SEARCH_URL,
+            headers=headers,
+            json=payload,
+            timeout=SERPER_ATTEMPT_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    return await retry_async(post, _is_transient_error, attempts=SERPER_ATTEMPTS)
+
+
+async def afetch_search_results(
     query: str, api_key: str, max_results: int = 5
 ) -> List[APISearchResult]:
     """
-    Fetches search results from the Serper API.
+    Fetches search results from the Serper API without leaving the event loop.
 
     Args:
         query: The search query
@@ -47,25 +181,45 @@ def fetch_search_results(
         max_results: Maximum number of results to return (default: 5)
 
     Returns:
-        A list of APISearchResult objects from Serper API
+        A list of APISearchResult objects from Serper API, empty if the query
+        genuinely has no hits
+
+    Raises:
+        Exception: If the request fails, so callers can tell an outage from a
+            valid empty response
     """
-    url = "https://google.serper.dev/search"
-    payload = json.dumps({"q": query, "num": max_results})
-    headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
+    payload = {"q": query, "num": max_results}
+    data = await _apost_search(payload, api_key)
+    return _parse_search_response(data, max_results)
 
-    try:
-        response = requests.post(url, headers=headers, data=payload)
-        response.raise_for_status()
-        data = response.json()
 
-        # Process and return the search results
-        if "organic" in data:
-            results = _convert_organic_results(data["organic"])
-            return results[:max_results]  # Ensure we don't exceed max_results
-        return []
-    except Exception as e:
-        logger.error(f"Error fetching search results: {str(e)}")
-        return []
+async def afetch_search_results_batch(
+    queries: List[Tuple[str, int]], api_key: str
+) -> List[List[APISearchResult]]:
+    """
+    Fetches results for several queries in one Serper API request.
+
+    Args:
+        queries: (query, max_results) pairs to search for
+        api_key: The Serper API key
+
+    Returns:
+        One list of APISearchResult objects per query, in the same order
+
+    Raises:
+        Exception: If the request fails
+        ValueError: If the response is not one entry per query
+    """
+    payload = [{"q": query, "num": max_results} for query, max_results in queries]
+    responses = await _apost_search(payload, api_key)
+    if not isinstance(responses, list) or len(responses) != len(queries):
+        raise ValueError(
+            f"Serper returned a malformed batch response for {len(queries)} queries"
+        )
+    return [
+        _parse_search_response(data, max_results)
+        for data, (_, max_results) in zip(responses, queries)
+    ]
 
 
 def scrape_webpage(url: str, api_key: str) -> Optional[str]:
@@ -83,35 +237,56 @@ def scrape_webpage(url: str, api_key: str) -> Optional[str]:
     Returns:
         Markdown-formatted content from the webpage, or None if scraping fails
     """
+    cached = SCRAPED_PAGES_CACHE.get(url)
+    if cached is not None:
+        return cached
+
     scrape_url = "https://scrape.serper.dev"
     payload = json.dumps({"url": url})
     headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
 
     try:
-        logger.info(f"Scraping webpage via Serper: {url}")
-        response = requests.post(scrape_url, headers=headers, data=payload, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        logger.info("Scraping webpage via Serper: %s", url)
+        response = HTTP_SESSION.post(
+            scrape_url, headers=headers, data=payload, timeout=10, stream=True
+        )
+        try:
+            response.raise_for_status()
+            body, truncated = _read_capped(response, SCRAPE_MAX_RESPONSE_BYTES)
+        finally:
+            response.close()
 
         # Extract markdown content from response
         # Serper returns text and optional markdown in the response
-        markdown_content = data.get("text", "")
+        if truncated:
+            # Keep what arrived rather than refetching the whole page locally
+            logger.warning(
+                "Serper scrape response for %s exceeded %d bytes, truncating",
+                url,
+                SCRAPE_MAX_RESPONSE_BYTES,
+            )
+            markdown_content = _text_from_prefix(body)
+        else:
+            markdown_content = json.loads(body).get("text", "")
 
         if markdown_content:
+            # Anything past the limit would be truncated downstream anyway
+            markdown_content = markdown_content[:MAX_CONTENT_LENGTH]
             logger.info(
-                f"Successfully scraped {len(markdown_content)} chars from {url}"
+                "Successfully scraped %d chars from %s", len(markdown_content), url
             )
+            SCRAPED_PAGES_CACHE.set(url, markdown_content)
             return markdown_content
 
-        logger.warning(f"No content returned from Serper scrape for {url}")
+        logger.warning("No content returned from Serper scrape for %s", url)
         return None
 
     except requests.exceptions.Timeout:
-        logger.error(f"Timeout scraping webpage via Serper: {url}")
+        logger.error("Timeout scraping webpage via Serper: %s", url)
         return None
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error scraping webpage via Serper: {str(e)}")
+        logger.error("Request error scraping webpage via Serper: %s", e)
         return None
     except Exception as e:
-        logger.exception(f"Unexpected error scraping webpage via Serper: {str(e)}")
+        logger.exception("Unexpected error scraping webpage via Serper: %s", e)
         return None
@@ -7,6 +7,15 @@
 
 import os
 
+
+def _timeout_from_env(name: str, default: float) -> float:
+    """Read a duration in seconds from the environment, falling back to default."""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
 # Application version
 VERSION = "2.5.1"
 
@@ -14,14 +23,14 @@ VERSION = "2.5.1"
 SERVICE_NAME = "WebCat MCP Server"
 SERVICE_DESCRIPTION = "Web search and content extraction with MCP protocol support"
 
-# Server capabilities
-CAPABILITIES = [
+# Server capabilities (immutable, shared by every info/status response)
+CAPABILITIES = (
     "Web search with Serper API",
     "DuckDuckGo fallback search",
     "Content extraction and scraping",
     "Markdown conversion",
     "FastMCP protocol support",
-]
+)
 
 # Content limits
 try:
@@ -29,9 +38,49 @@ try:
 except ValueError:
     MAX_CONTENT_LENGTH = 1000000
 DEFAULT_SEARCH_RESULTS = 5
+# Every result is scraped, so bound how many a single search may ask for
+MAX_SEARCH_RESULTS = 10
+
+# In-process result caches
+SEARCH_CACHE_MAX_ENTRIES = 256
+SEARCH_CACHE_TTL_SECONDS = _timeout_from_env("WEBCAT_SEARCH_CACHE_TTL", 300.0)
+SCRAPE_CACHE_MAX_ENTRIES = 256
+SCRAPE_CACHE_TTL_SECONDS = _timeout_from_env("WEBCAT_SCRAPE_CACHE_TTL", 300.0)
+HEALTH_CACHE_TTL_SECONDS = 1
+# Pooled Perplexity clients, keyed by caller-supplied API key
+PERPLEXITY_CLIENT_CACHE_MAX_ENTRIES = 32
+PERPLEXITY_CLIENT_CACHE_TTL_SECONDS = 60 * 60.0
+
+# How long validators for directly fetched pages are kept for revalidation
+SCRAPE_REVALIDATE_TTL_SECONDS = _timeout_from_env(
+    "WEBCAT_SCRAPE_REVALIDATE_TTL", 24 * 60 * 60.0
+)
 
 # Timeout settings
 REQUEST_TIMEOUT_SECONDS = 5
+
+
+# Serper calls are retried, so each attempt gets a shorter timeout than the
+# whole call; the budget covers every attempt plus backoff between them
+SERPER_ATTEMPTS = 3
+SERPER_ATTEMPT_TIMEOUT_SECONDS = _timeout_from_env(
+    "WEBCAT_SERPER_ATTEMPT_TIMEOUT_S", 2.0
+)
+
+# Upper bounds on each upstream call as awaited by the search orchestrator
+SERPER_TIMEOUT_SECONDS = _timeout_from_env(
+    "WEBCAT_SERPER_TIMEOUT_S", SERPER_ATTEMPTS * SERPER_ATTEMPT_TIMEOUT_SECONDS + 1.0
+)
+DUCKDUCKGO_TIMEOUT_SECONDS = _timeout_from_env("WEBCAT_DDG_TIMEOUT_S", 5.0)
+SCRAPE_TIMEOUT_SECONDS = _timeout_from_env("WEBCAT_SCRAPE_TIMEOUT_S", 15.0)
+
+# Window for batching concurrent Serper searches into one request (0 disables)
+SERPER_BATCH_WINDOW_SECONDS = _timeout_from_env("WEBCAT_SERPER_BATCH_WINDOW_S", 0.0)
+
+# Most calls in flight per upstream; DuckDuckGo rate-limits aggressively
+SERPER_MAX_CONCURRENCY = 20
+DUCKDUCKGO_MAX_CONCURRENCY = 5
+
 HEARTBEAT_INTERVAL_SECONDS = 30
 
 # Logging
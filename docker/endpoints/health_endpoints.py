@@ -5,21 +5,25 @@
 
 """Health and status endpoint handlers."""
 
+import json
 import logging
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
-from models.health_responses import (
+from models.responses.health_responses import (
+    ROOT_INFO,
     get_detailed_status,
     get_health_status,
-    get_root_info,
     get_status_error,
     get_unhealthy_status,
 )
 
 logger = logging.getLogger(__name__)
 
+# The root payload never changes, so encode it once
+ROOT_INFO_BODY = json.dumps(ROOT_INFO).encode()
+
 
 def setup_health_endpoints(app: FastAPI):
     """Setup health and utility endpoints for the WebCat server."""
@@ -28,21 +32,22 @@ def setup_health_endpoints(app: FastAPI):
     async def health_check():
         """Health check endpoint for monitoring."""
         try:
-            return get_health_status()
+            # Plain JSON payloads skip FastAPI's jsonable_encoder pass
+            return JSONResponse(content=get_health_status())
         except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
+            logger.error("Health check failed: %s", e)
             return JSONResponse(status_code=500, content=get_unhealthy_status(str(e)))
 
     @app.get("/status")
     async def server_status():
         """Detailed server status endpoint."""
         try:
-            return get_detailed_status()
+            return JSONResponse(content=get_detailed_status())
         except Exception as e:
-            logger.error(f"Status check failed: {str(e)}")
+            logger.error("Status check failed: %s", e)
             return JSONResponse(status_code=500, content=get_status_error(str(e)))
 
     @app.get("/")
     async def root():
         """Root endpoint with basic information."""
-        return get_root_info()
+        return Response(content=ROOT_INFO_BODY, media_type="application/json")
@@ -10,8 +10,8 @@ Type Safety Architecture:
 This module uses Pydantic models for strong typing throughout:
 
 1. **Internal Functions**: Return typed Pydantic models
-   - fetch_search_results() -> List[APISearchResult]
-   - process_search_results() -> List[SearchResult]
+   - afetch_search_results() -> List[APISearchResult]
+   - scrape_search_result() -> SearchResult
    - Full type safety, IDE autocomplete, mypy validation
 
 2. **MCP Tool Functions**: Only convert to dict at the boundary
@@ -44,6 +44,7 @@ import os
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
+from utils.event_loop import install_uvloop
 from utils.logging_config import setup_logging
 
 # Load environment variables FIRST before importing tools
@@ -94,6 +95,7 @@ mcp_server.tool(name="health_check", description="Check the health of the server
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
+    install_uvloop()
     logging.info(
         f"Starting FastMCP server on port {port} (no auth - use nginx proxy for auth)"
     )
@@ -7,7 +7,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class SearchResult(BaseModel):
@@ -17,3 +17,6 @@ class SearchResult(BaseModel):
     url: Optional[str] = ""
     snippet: str
     content: str = ""
+    # Set when content is an error or snippet fallback rather than the page;
+    # kept out of serialized responses
+    scrape_failed: bool = Field(default=False, exclude=True)
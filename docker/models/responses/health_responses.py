@@ -31,23 +31,30 @@ def get_unhealthy_status(error: str) -> dict:
     }
 
 
+# The environment is fixed once the server starts, so read it a single time
+SERVER_CONFIGURATION = {
+    "serper_api_configured": bool(os.environ.get("SERPER_API_KEY")),
+    "port": int(os.environ.get("PORT", 8000)),
+    "log_level": os.environ.get("LOG_LEVEL", "INFO"),
+    "log_dir": os.environ.get("LOG_DIR", "/tmp"),
+}
+
+
 def get_server_configuration() -> dict:
     """Get server configuration dictionary."""
-    return {
-        "serper_api_configured": bool(os.environ.get("SERPER_API_KEY")),
-        "port": int(os.environ.get("PORT", 8000)),
-        "log_level": os.environ.get("LOG_LEVEL", "INFO"),
-        "log_dir": os.environ.get("LOG_DIR", "/tmp"),
-    }
+    return dict(SERVER_CONFIGURATION)
+
+
+SERVER_ENDPOINTS = {
+    "mcp": "/mcp",
+    "health": "/health",
+    "status": "/status",
+}
 
 
 def get_server_endpoints() -> dict:
     """Get server endpoints dictionary."""
-    return {
-        "mcp": "/mcp",
-        "health": "/health",
-        "status": "/status",
-    }
+    return dict(SERVER_ENDPOINTS)
 
 
 def get_detailed_status() -> dict:
@@ -59,7 +66,7 @@ def get_detailed_status() -> dict:
         "timestamp": time.time(),
         "configuration": get_server_configuration(),
         "endpoints": get_server_endpoints(),
-        "capabilities": CAPABILITIES,
+        "capabilities": list(CAPABILITIES),
     }
 
 
@@ -72,16 +79,15 @@ def get_status_error(error: str) -> dict:
     }
 
 
+ROOT_INFO = {
+    "service": SERVICE_NAME,
+    "version": VERSION,
+    "description": "Web search and content extraction with MCP protocol support",
+    "endpoints": SERVER_ENDPOINTS,
+    "documentation": "MCP server - connect via SSE at /mcp/sse endpoint",
+}
+
+
 def get_root_info() -> dict:
     """Get root endpoint information."""
-    return {
-        "service": SERVICE_NAME,
-        "version": VERSION,
-        "description": "Web search and content extraction with MCP protocol support",
-        "endpoints": {
-            "mcp": "/mcp",
-            "health": "/health",
-            "status": "/status",
-        },
-        "documentation": "MCP server - connect via SSE at /mcp/sse endpoint",
-    }
+    return {**ROOT_INFO, "endpoints": get_server_endpoints()}
@@ -7,22 +7,38 @@
 
 import logging
 import os
+from typing import Any, Dict, Optional
 
 import requests
 import trafilatura
 
+from clients.http_session import HTTP_SESSION
 from clients.serper_client import scrape_webpage as serper_scrape_webpage
-from constants import MAX_CONTENT_LENGTH, REQUEST_TIMEOUT_SECONDS
-from models.search_result import SearchResult
+from constants import (
+    MAX_CONTENT_LENGTH,
+    REQUEST_TIMEOUT_SECONDS,
+    SCRAPE_CACHE_MAX_ENTRIES,
+    SCRAPE_REVALIDATE_TTL_SECONDS,
+)
+from models.domain.search_result import SearchResult
+from utils.executors import PARSE_POOL
+from utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Validators and extracted markdown of directly fetched pages, so a repeat
+# fetch of an unchanged page comes back as a bodiless 304 Not Modified
+REVALIDATION_CACHE = TTLCache(SCRAPE_CACHE_MAX_ENTRIES, SCRAPE_REVALIDATE_TTL_SECONDS)
 
-def _fetch_content(url: str) -> requests.Response:
+
+def _fetch_content(
+    url: str, cached: Optional[Dict[str, Any]] = None
+) -> requests.Response:
     """Fetch content from URL with browser-like headers.
 
     Args:
         url: URL to fetch
+        cached: Revalidation entry for the URL, sent as conditional headers
 
     Returns:
         HTTP response object
@@ -38,7 +54,12 @@ def _fetch_content(url: str) -> requests.Response:
         "Upgrade-Insecure-Requests": "1",
         "Cache-Control": "max-age=0",
     }
-    response = requests.get(url, timeout=REQUEST_TIMEOUT_SECONDS, headers=headers)
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+    response = HTTP_SESSION.get(url, timeout=REQUEST_TIMEOUT_SECONDS, headers=headers)
     response.raise_for_status()
     return response
 
@@ -83,6 +104,48 @@ def _truncate_if_needed(content: str) -> str:
     return content
 
 
+def _extract_markdown(html: bytes, url: str) -> Optional[str]:
+    """Extract the main article from HTML as markdown using Trafilatura.
+
+    This is the CPU-bound part of scraping; it is a module-level function so
+    it can be sent to the parse process pool.
+
+    Args:
+        html: Raw page content
+        url: Page URL, used by Trafilatura for link resolution and metadata
+
+    Returns:
+        Extracted markdown, or None if nothing could be extracted
+    """
+    return trafilatura.extract(
+        html,
+        output_format="markdown",
+        include_comments=False,
+        include_tables=True,
+        no_fallback=False,
+        url=url,
+    )
+
+
+def _remember_extraction(
+    url: str, response: requests.Response, extracted: Optional[str]
+) -> None:
+    """Keep extracted markdown for revalidation if the page sent validators.
+
+    Args:
+        url: Page URL
+        response: Full (200) response the markdown was extracted from
+        extracted: Markdown extracted from the response
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if extracted and (etag or last_modified):
+        REVALIDATION_CACHE.set(
+            url,
+            {"etag": etag, "last_modified": last_modified, "markdown": extracted},
+        )
+
+
 def scrape_search_result(result: SearchResult) -> SearchResult:
     """
     Scrapes the content of a search result URL and converts it to markdown.
@@ -94,17 +157,19 @@ def scrape_search_result(result: SearchResult) -> SearchResult:
         result: SearchResult object with URL to scrape
 
     Returns:
-        Updated SearchResult with content in markdown format
+        Updated SearchResult with content in markdown format, flagged with
+        scrape_failed when only an error or the snippet could be returned
     """
     if not result.url:
         result.content = "Error: Missing URL for content scraping."
+        result.scrape_failed = True
         return result
 
     # Try Serper scraping first if API key is available
     serper_api_key = os.environ.get("SERPER_API_KEY", "")
     if serper_api_key:
         try:
-            logger.info(f"Using Serper scrape API for {result.url}")
+            logger.info("Using Serper scrape API for %s", result.url)
             scraped_content = serper_scrape_webpage(result.url, serper_api_key)
 
             if scraped_content:
@@ -114,44 +179,52 @@ def scrape_search_result(result: SearchResult) -> SearchResult:
                 )
                 result.content = _truncate_if_needed(full_content)
                 logger.info(
-                    f"Successfully scraped via Serper: {len(result.content)} chars"
+                    "Successfully scraped via Serper: %d chars", len(result.content)
                 )
                 return result
 
             logger.warning(
-                f"Serper scrape returned no content for {result.url}, falling back to Trafilatura"
+                "Serper scrape returned no content for %s, falling back to Trafilatura",
+                result.url,
             )
         except Exception as e:
             logger.warning(
-                f"Serper scrape failed for {result.url}: {str(e)}, falling back to Trafilatura"
+                "Serper scrape failed for %s: %s, falling back to Trafilatura",
+                result.url,
+                e,
             )
 
     # Fallback to Trafilatura scraping
     try:
-        logger.info(f"Using Trafilatura for {result.url}")
-        response = _fetch_content(result.url)
-        content_type = response.headers.get("Content-Type", "").lower()
-
-        if "text/plain" in content_type:
-            result.content = _handle_plain_text(response, result)
-            return result
+        logger.info("Using Trafilatura for %s", result.url)
+        cached = REVALIDATION_CACHE.get(result.url)
+        response = _fetch_content(result.url, cached)
+
+        if cached is not None and response.status_code == 304:
+            logger.info("Page unchanged, reusing extracted content: %s", result.url)
+            extracted = cached["markdown"]
+        else:
+            content_type = response.headers.get("Content-Type", "").lower()
+
+            if "text/plain" in content_type:
+                result.content = _handle_plain_text(response, result)
+                return result
 
-        if (
-            "application/pdf" in content_type
-            or "application/octet-stream" in content_type
-        ):
-            result.content = _handle_binary_content(content_type, result)
-            return result
+            if (
+                "application/pdf" in content_type
+                or "application/octet-stream" in content_type
+            ):
+                result.content = _handle_binary_content(content_type, result)
+                return result
 
-        # Use Trafilatura for clean article extraction
-        extracted = trafilatura.extract(
-            response.content,
-            output_format="markdown",
-            include_comments=False,
-            include_tables=True,
-            no_fallback=False,
-            url=result.url,
-        )
+            # Use Trafilatura for clean article extraction, off the GIL if enabled
+            if PARSE_POOL is not None:
+                extracted = PARSE_POOL.submit(
+                    _extract_markdown, response.content, result.url
+                ).result()
+            else:
+                extracted = _extract_markdown(response.content, result.url)
+            _remember_extraction(result.url, response, extracted)
 
         if extracted and len(extracted.strip()) > 100:
             # Remove first line if it's a duplicate title (common in Trafilatura output)
@@ -167,12 +240,15 @@ def scrape_search_result(result: SearchResult) -> SearchResult:
             return result
 
         # Fallback if Trafilatura fails
-        logger.warning(f"Trafilatura extraction failed for {result.url}")
+        logger.warning("Trafilatura extraction failed for %s", result.url)
         result.content = f"# {result.title}\n\n*Source: {result.url}*\n\n{result.snippet}\n\n(Full content extraction failed - only snippet available)"
+        result.scrape_failed = True
         return result
     except requests.RequestException as e:
         result.content = f"Error: Failed to retrieve the webpage. {str(e)}"
+        result.scrape_failed = True
         return result
     except Exception as e:
         result.content = f"Error: Failed to scrape content. {str(e)}"
+        result.scrape_failed = True
         return result
@@ -7,43 +7,168 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Tuple
+import os
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, TypeVar
+
+from pydantic import TypeAdapter
 
 from clients.duckduckgo_client import fetch_duckduckgo_search_results
-from clients.serper_client import fetch_search_results
-from models.api_search_result import APISearchResult
-from services.search_processor import process_search_results
+from clients.serper_batcher import SerperBatcher
+from clients.serper_client import afetch_search_results
+from constants import (
+    DEFAULT_SEARCH_RESULTS,
+    DUCKDUCKGO_MAX_CONCURRENCY,
+    DUCKDUCKGO_TIMEOUT_SECONDS,
+    MAX_SEARCH_RESULTS,
+    SCRAPE_TIMEOUT_SECONDS,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL_SECONDS,
+    SERPER_BATCH_WINDOW_SECONDS,
+    SERPER_MAX_CONCURRENCY,
+    SERPER_TIMEOUT_SECONDS,
+)
+from models.domain.api_search_result import APISearchResult
+from models.domain.search_result import SearchResult
+from services.content_scraper import scrape_search_result
+from services.search_processor import to_search_result
+from utils.circuit_breaker import CircuitBreaker
+from utils.executors import SCRAPE_POOL, SEARCH_POOL
+from utils.inflight import InflightRequests
+from utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Serializes a whole result list in one pydantic-core call
+RESULTS_ADAPTER = TypeAdapter(List[SearchResult])
+
+# Race Serper against DuckDuckGo instead of falling back sequentially
+HEDGE_ENABLED = os.environ.get("WEBCAT_HEDGE") == "1"
+
+# Concurrent Serper searches share one request when a batch window is set
+SERPER_BATCHER = (
+    SerperBatcher(SERPER_BATCH_WINDOW_SECONDS) if SERPER_BATCH_WINDOW_SECONDS else None
+)
+
+# Skip Serper for a cool-down window once it keeps failing
+SERPER_BREAKER = CircuitBreaker("Serper API", failure_threshold=5, reset_timeout=30)
+
+# Cap calls in flight per upstream so bursts queue here instead of tripping
+# rate limits; time spent queued counts against each call's timeout
+SERPER_LIMIT = asyncio.Semaphore(SERPER_MAX_CONCURRENCY)
+DUCKDUCKGO_LIMIT = asyncio.Semaphore(DUCKDUCKGO_MAX_CONCURRENCY)
+
+# Repeat queries within the TTL are answered without any network calls
+SEARCH_CACHE = TTLCache(SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_TTL_SECONDS)
+
+# Searches currently running, keyed like SEARCH_CACHE
+SEARCH_INFLIGHT = InflightRequests()
+
+
+def clamp_max_results(max_results: int) -> int:
+    """Bound a client-supplied result count to what one search may scrape.
+
+    Args:
+        max_results: Number of results requested by the client
+
+    Returns:
+        The count clamped to between 1 and MAX_SEARCH_RESULTS
+    """
+    return max(1, min(max_results, MAX_SEARCH_RESULTS))
+
+
+async def run_with_timeout(
+    pool: Executor, timeout: float, func: Callable[..., T], *args: Any
+) -> T:
+    """Run a blocking call on a worker pool, giving up after timeout seconds.
+
+    The timeout bounds how long the caller waits; the worker thread itself
+    keeps running until the underlying call returns.
+
+    Args:
+        pool: Executor to run the call on
+        timeout: Seconds to wait for the result
+        func: Blocking function to call
+        *args: Positional arguments for func
+
+    Returns:
+        The function's return value
+
+    Raises:
+        asyncio.TimeoutError: If the call doesn't finish within timeout
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(pool, func, *args), timeout=timeout
+    )
+
+
+async def run_limited(
+    limit: asyncio.Semaphore, func: Callable[..., Awaitable[T]], *args: Any
+) -> T:
+    """Call func and await its result while holding a slot of limit.
+
+    Args:
+        limit: Semaphore bounding concurrent calls
+        func: Function returning an awaitable; only called once a slot is free
+        *args: Positional arguments for func
+
+    Returns:
+        The awaited result
+    """
+    async with limit:
+        return await func(*args)
+
 
 async def fetch_with_serper(
-    query: str, api_key: str
+    query: str, api_key: str, max_results: int = DEFAULT_SEARCH_RESULTS
 ) -> Tuple[List[APISearchResult], str]:
     """Fetch search results using Serper API.
 
     Args:
         query: Search query
         api_key: Serper API key
+        max_results: Number of results to request
 
     Returns:
         Tuple of (results, search_source)
     """
+    if not SERPER_BREAKER.allow_request():
+        logger.warning("Serper API circuit open, skipping to fallback")
+        return [], "Serper API"
+
     logger.info("Using Serper API for search")
-    results = await asyncio.get_event_loop().run_in_executor(
-        None, fetch_search_results, query, api_key
-    )
+    try:
+        search = SERPER_BATCHER.search if SERPER_BATCHER else afetch_search_results
+        results = await asyncio.wait_for(
+            run_limited(SERPER_LIMIT, search, query, api_key, max_results),
+            timeout=SERPER_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Serper API timed out after %ss", SERPER_TIMEOUT_SECONDS)
+        SERPER_BREAKER.record_failure()
+        return [], "Serper API"
+    except Exception as e:
+        logger.error("Error fetching search results: %s", e)
+        SERPER_BREAKER.record_failure()
+        return [], "Serper API"
+
+    # A query with no hits is still a healthy response
+    SERPER_BREAKER.record_success()
     return results, "Serper API"
 
 
 async def fetch_with_duckduckgo(
-    query: str, has_api_key: bool
+    query: str, has_api_key: bool, max_results: int = DEFAULT_SEARCH_RESULTS
 ) -> Tuple[List[APISearchResult], str]:
     """Fetch search results using DuckDuckGo.
 
     Args:
         query: Search query
         has_api_key: Whether Serper API key was configured
+        max_results: Number of results to request
 
     Returns:
         Tuple of (results, search_source)
@@ -53,12 +178,80 @@ async def fetch_with_duckduckgo(
     else:
         logger.warning("No results from Serper API, trying DuckDuckGo fallback")
 
-    results = await asyncio.get_event_loop().run_in_executor(
-        None, fetch_duckduckgo_search_results, query
-    )
+    return await search_duckduckgo(query, max_results)
+
+
+async def search_duckduckgo(
+    query: str, max_results: int = DEFAULT_SEARCH_RESULTS
+) -> Tuple[List[APISearchResult], str]:
+    """Run a DuckDuckGo search on the search pool within its time budget.
+
+    Args:
+        query: Search query
+        max_results: Number of results to request
+
+    Returns:
+        Tuple of (results, search_source), with no results on timeout
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        # The pool call is only submitted once a concurrency slot is free
+        results = await asyncio.wait_for(
+            run_limited(
+                DUCKDUCKGO_LIMIT,
+                loop.run_in_executor,
+                SEARCH_POOL,
+                fetch_duckduckgo_search_results,
+                query,
+                max_results,
+            ),
+            timeout=DUCKDUCKGO_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        logger.warning("DuckDuckGo timed out after %ss", DUCKDUCKGO_TIMEOUT_SECONDS)
+        results = []
     return results, "DuckDuckGo (free fallback)"
 
 
+async def fetch_hedged(
+    query: str, api_key: str, max_results: int = DEFAULT_SEARCH_RESULTS
+) -> Tuple[List[APISearchResult], str]:
+    """Race Serper against DuckDuckGo and keep the first non-empty response.
+
+    Serper wins ties. If both come back empty or fail, an empty result list
+    is returned with the source that answered last.
+
+    Args:
+        query: Search query
+        api_key: Serper API key
+        max_results: Number of results to request from each provider
+
+    Returns:
+        Tuple of (results, search_source)
+    """
+    logger.info("Hedging Serper API and DuckDuckGo searches")
+    serper_task = asyncio.ensure_future(fetch_with_serper(query, api_key, max_results))
+    ddg_task = asyncio.ensure_future(search_duckduckgo(query, max_results))
+    pending = {serper_task, ddg_task}
+    search_source = "Unknown"
+
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in (serper_task, ddg_task):
+            if task not in done:
+                continue
+            if task.exception() is not None:
+                logger.warning("Hedged search failed: %s", task.exception())
+                continue
+            results, search_source = task.result()
+            if results:
+                for other in pending:
+                    other.cancel()
+                return results, search_source
+
+    return [], search_source
+
+
 def format_no_results_error(query: str, search_source: str) -> Dict[str, Any]:
     """Format error response for no results.
 
@@ -107,23 +300,53 @@ async def process_and_format_results(
     Returns:
         Formatted results dictionary
     """
-    processed_results = await asyncio.get_event_loop().run_in_executor(
-        None, process_search_results, results
+    # Scrape every URL concurrently on the scrape pool instead of one by one
+    search_results = [to_search_result(result) for result in results]
+    scraped = await asyncio.gather(
+        *[
+            run_with_timeout(
+                SCRAPE_POOL, SCRAPE_TIMEOUT_SECONDS, scrape_search_result, result
+            )
+            for result in search_results
+        ],
+        return_exceptions=True,
     )
 
+    # A failed scrape becomes an error entry instead of failing the whole search
+    processed_results: List[SearchResult] = []
+    for search_result, outcome in zip(search_results, scraped):
+        if isinstance(outcome, asyncio.TimeoutError):
+            logger.error("Timed out scraping %s", search_result.url)
+            search_result.content = (
+                f"Error: Scraping timed out after {SCRAPE_TIMEOUT_SECONDS}s."
+            )
+            search_result.scrape_failed = True
+            outcome = search_result
+        elif isinstance(outcome, Exception):
+            logger.error("Failed to scrape %s: %s", search_result.url, outcome)
+            search_result.content = f"Error: Failed to scrape content. {str(outcome)}"
+            search_result.scrape_failed = True
+            outcome = search_result
+        processed_results.append(outcome)
+
     return {
         "query": query,
         "search_source": search_source,
-        "results": [result.model_dump() for result in processed_results],
+        "results": RESULTS_ADAPTER.dump_python(processed_results),
     }
 
 
-async def execute_search(query: str, serper_api_key: str = "") -> Dict[str, Any]:
+async def execute_search(
+    query: str,
+    serper_api_key: str = "",
+    max_results: int = DEFAULT_SEARCH_RESULTS,
+) -> Dict[str, Any]:
     """Execute search with automatic fallback logic.
 
     Args:
         query: Search query
         serper_api_key: Optional Serper API key
+        max_results: Maximum number of results to scrape and return
 
     Returns:
         Formatted search results dictionary
@@ -132,24 +355,71 @@ async def execute_search(query: str, serper_api_key: str = "") -> Dict[str, Any]
     search_source = "Unknown"
 
     try:
-        # Try Serper API first if key is available
-        if serper_api_key:
-            results, search_source = await fetch_with_serper(query, serper_api_key)
-
-        # Fall back to DuckDuckGo if no API key or no results from Serper
-        if not results:
-            results, search_source = await fetch_with_duckduckgo(
-                query, bool(serper_api_key)
+        if serper_api_key and HEDGE_ENABLED:
+            # Race both providers instead of waiting on Serper first
+            results, search_source = await fetch_hedged(
+                query, serper_api_key, max_results
             )
+        else:
+            # Try Serper API first if key is available
+            if serper_api_key:
+                results, search_source = await fetch_with_serper(
+                    query, serper_api_key, max_results
+                )
+
+            # Fall back to DuckDuckGo if no API key or no results from Serper
+            if not results:
+                results, search_source = await fetch_with_duckduckgo(
+                    query, bool(serper_api_key), max_results
+                )
 
         # Check if we got any results
         if not results:
-            logger.warning(f"No search results found for query: {query}")
+            logger.warning("No search results found for query: %s", query)
             return format_no_results_error(query, search_source)
 
-        # Process and format results
-        return await process_and_format_results(results, query, search_source)
+        # Process and format results, only scraping the ones we will return
+        return await process_and_format_results(
+            results[:max_results], query, search_source
+        )
 
     except Exception as e:
-        logger.error(f"Error in search function: {str(e)}")
+        logger.exception("Error in search function")
         return format_search_error(str(e), query, search_source)
+
+
+async def execute_cached_search(
+    query: str,
+    serper_api_key: str = "",
+    max_results: int = DEFAULT_SEARCH_RESULTS,
+) -> Dict[str, Any]:
+    """Execute a search, reusing a cached or in-flight identical search.
+
+    Args:
+        query: Search query
+        serper_api_key: Optional Serper API key
+        max_results: Maximum number of results to scrape and return
+
+    Returns:
+        Formatted search results dictionary; cached values are shared, so
+        callers must treat it as read-only
+    """
+    # Keyed on the API key too, so one key never answers with another's results
+    cache_key = (query, max_results, serper_api_key)
+    cached = SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached search results for: %s", query)
+        return cached
+
+    async def search() -> Dict[str, Any]:
+        result = await execute_search(query, serper_api_key, max_results)
+
+        # Errors and empty searches are retried on the next request
+        if "error" not in result:
+            SEARCH_CACHE.set(cache_key, result)
+        return result
+
+    # Identical concurrent queries share the search already in progress
+    if cache_key in SEARCH_INFLIGHT:
+        logger.info("Joining in-flight search for: %s", query)
+    return await SEARCH_INFLIGHT.run(cache_key, search)
@@ -3,37 +3,24 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-"""Search processor service - processes API results into enriched search results."""
+"""Search processor service - converts API results into search results."""
 
-from typing import List
+from models.domain.api_search_result import APISearchResult
+from models.domain.search_result import SearchResult
 
-from models.api_search_result import APISearchResult
-from models.search_result import SearchResult
-from services.content_scraper import scrape_search_result
 
-
-def process_search_results(results: List[APISearchResult]) -> List[SearchResult]:
-    """
-    Processes API search results into SearchResult objects with scraped content.
+def to_search_result(api_result: APISearchResult) -> SearchResult:
+    """Create an unscraped SearchResult from an API search result.
 
     Args:
-        results: List of APISearchResult objects from search APIs
+        api_result: APISearchResult from a search API
 
     Returns:
-        List of SearchResult objects with scraped content
+        SearchResult with title, URL and snippet filled in
     """
-    processed_results: List[SearchResult] = []
-
-    for api_result in results:
-        # Create a SearchResult object from API result
-        search_result = SearchResult(
-            title=api_result.title,
-            url=api_result.link,
-            snippet=api_result.snippet,
-        )
-
-        # Scrape content for the result
-        search_result = scrape_search_result(search_result)
-        processed_results.append(search_result)
-
-    return processed_results
+    # Fields were already validated on the APISearchResult
+    return SearchResult.model_construct(
+        title=api_result.title,
+        url=api_result.link,
+        snippet=api_result.snippet,
+    )
@@ -100,6 +100,15 @@ class HttpResponseFactory:
             content=html.encode(), headers={"Content-Type": "text/html"}
         )
 
+    @staticmethod
+    def not_modified() -> MockHttpResponse:
+        """Create 304 response to a conditional request.
+
+        Returns:
+            MockHttpResponse with 304 status and no body
+        """
+        return MockHttpResponse(status_code=304)
+
     @staticmethod
     def pdf() -> MockHttpResponse:
         """Create PDF response.
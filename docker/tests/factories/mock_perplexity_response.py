@@ -66,22 +66,33 @@ class MockPerplexityResponse:
 
 
 class MockPerplexityClient:
-    """Typed mock for Perplexity client."""
+    """Typed mock for the async Perplexity client."""
 
-    def __init__(self, response: MockPerplexityResponse):
+    def __init__(
+        self,
+        response: MockPerplexityResponse,
+        error: Optional[Exception] = None,
+    ):
         """Initialize mock client with predefined response.
 
         Args:
             response: Response to return from API calls
+            error: Exception to raise from API calls instead of responding
         """
         self._response = response
+        self._error = error
         self.chat = self
         self.completions = self
 
-    def create(self, **kwargs) -> MockPerplexityResponse:
+    async def create(self, **kwargs) -> MockPerplexityResponse:
         """Mock create method that returns configured response.
 
         Returns:
             Configured MockPerplexityResponse
+
+        Raises:
+            Exception: The configured error, if any
         """
+        if self._error is not None:
+            raise self._error
         return self._response
@@ -0,0 +1,35 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Typed mock for batched Serper API responses - no raw property assignment."""
+
+from typing import Any, Dict, List
+
+from tests.factories.mock_serper_response import MockSerperResponse
+
+
+class MockSerperBatchResponse:
+    """Typed mock for a Serper response to a batch of queries."""
+
+    def __init__(self, responses: List[MockSerperResponse], status_code: int = 200):
+        """Initialize mock batch response.
+
+        Args:
+            responses: One single-query response per batched query, in order
+            status_code: HTTP status code
+        """
+        self.status_code = status_code
+        self._json_data = [response.json() for response in responses]
+
+    def json(self) -> List[Dict[str, Any]]:
+        """Return JSON response data."""
+        return self._json_data
+
+    def raise_for_status(self):
+        """Raise HTTPError if status code indicates error."""
+        if self.status_code >= 400:
+            import requests
+
+            raise requests.HTTPError(f"{self.status_code} Error")
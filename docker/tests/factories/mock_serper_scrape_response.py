@@ -0,0 +1,42 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Typed mock for streamed Serper scrape responses - no raw property assignment."""
+
+import json
+from typing import Iterator
+
+
+class MockSerperScrapeResponse:
+    """Typed mock for a streamed Serper scrape API response."""
+
+    def __init__(self, text: str, status_code: int = 200, chunk_size: int = 16):
+        """Initialize mock scrape response.
+
+        Args:
+            text: Page text returned in the response body
+            status_code: HTTP status code
+            chunk_size: Size of the body chunks yielded while streaming
+        """
+        self.status_code = status_code
+        self.closed = False
+        self._body = json.dumps({"text": text}).encode()
+        self._chunk_size = chunk_size
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Yield the response body in fixed-size chunks."""
+        for start in range(0, len(self._body), self._chunk_size):
+            yield self._body[start : start + self._chunk_size]
+
+    def close(self):
+        """Record that the connection was released."""
+        self.closed = True
+
+    def raise_for_status(self):
+        """Raise HTTPError if status code indicates error."""
+        if self.status_code >= 400:
+            import requests
+
+            raise requests.HTTPError(f"{self.status_code} Error")
@@ -89,3 +89,15 @@ class PerplexityResponseFactory:
             MockPerplexityClient configured with response
         """
         return MockPerplexityClient(response)
+
+    @staticmethod
+    def client_with_error(error: Exception) -> MockPerplexityClient:
+        """Create mock client whose API calls raise an error.
+
+        Args:
+            error: Exception to raise from API calls
+
+        Returns:
+            MockPerplexityClient configured to fail
+        """
+        return MockPerplexityClient(PerplexityResponseFactory.empty_response(), error)
@@ -7,7 +7,9 @@
 
 from typing import Any, Dict, List
 
+from tests.factories.mock_serper_batch_response import MockSerperBatchResponse
 from tests.factories.mock_serper_response import MockSerperResponse
+from tests.factories.mock_serper_scrape_response import MockSerperScrapeResponse
 
 
 class SerperResponseFactory:
@@ -72,3 +74,27 @@ class SerperResponseFactory:
                 }
             ]
         )
+
+    @staticmethod
+    def batch(*responses: MockSerperResponse) -> MockSerperBatchResponse:
+        """Create a batched response answering several queries at once.
+
+        Args:
+            *responses: One single-query response per batched query, in order
+
+        Returns:
+            MockSerperBatchResponse wrapping the given responses
+        """
+        return MockSerperBatchResponse(list(responses))
+
+    @staticmethod
+    def scrape(text: str) -> MockSerperScrapeResponse:
+        """Create a streamed scrape response returning the given page text.
+
+        Args:
+            text: Page text returned by the scrape API
+
+        Returns:
+            MockSerperScrapeResponse with the text as its JSON body
+        """
+        return MockSerperScrapeResponse(text)
@@ -0,0 +1,22 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for the shared HTTP session."""
+
+from clients.http_session import HTTP_SESSION
+
+
+class TestHttpSession:
+    """Tests for the pooled HTTP session."""
+
+    def test_http_and_https_share_one_pooled_adapter(self):
+        # Act
+        https_adapter = HTTP_SESSION.get_adapter("https://google.serper.dev")
+        http_adapter = HTTP_SESSION.get_adapter("http://example.com")
+
+        # Assert
+        assert https_adapter is http_adapter
+        assert https_adapter._pool_maxsize == 64
+        assert https_adapter.max_retries.total == 0
@@ -5,17 +5,34 @@
 
 """Unit tests for Perplexity API client."""
 
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from clients.perplexity_client import fetch_perplexity_deep_research
+from clients.perplexity_client import (
+    PERPLEXITY_CLIENTS,
+    fetch_perplexity_deep_research,
+    get_perplexity_client,
+    research_system_message,
+)
 from tests.factories.perplexity_response_factory import PerplexityResponseFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_perplexity_clients():
+    """Start every test without cached Perplexity clients."""
+    PERPLEXITY_CLIENTS.clear()
+    yield
+    PERPLEXITY_CLIENTS.clear()
+
+
 @pytest.mark.unit
-@patch("clients.perplexity_client.Perplexity")
-def test_fetch_perplexity_deep_research_success(mock_perplexity_class):
+@pytest.mark.asyncio
+@patch("perplexity.AsyncPerplexity")
+async def test_fetch_perplexity_deep_research_success(mock_perplexity_class):
     """Test successful deep research fetch."""
     # Setup using factory
     response = PerplexityResponseFactory.successful_research()
@@ -23,7 +40,7 @@ def test_fetch_perplexity_deep_research_success(mock_perplexity_class):
     mock_perplexity_class.return_value = mock_client
 
     # Call function
-    report, citations = fetch_perplexity_deep_research(
+    report, citations = await fetch_perplexity_deep_research(
         query="What is Python?",
         api_key="test_key",  # pragma: allowlist secret
         max_results=3,
@@ -42,8 +59,9 @@ def test_fetch_perplexity_deep_research_success(mock_perplexity_class):
 
 
 @pytest.mark.unit
-@patch("clients.perplexity_client.Perplexity")
-def test_fetch_perplexity_deep_research_empty_response(mock_perplexity_class):
+@pytest.mark.asyncio
+@patch("perplexity.AsyncPerplexity")
+async def test_fetch_perplexity_deep_research_empty_response(mock_perplexity_class):
     """Test handling of empty response."""
     # Setup using factory
     response = PerplexityResponseFactory.empty_response()
@@ -51,7 +69,7 @@ def test_fetch_perplexity_deep_research_empty_response(mock_perplexity_class):
     mock_perplexity_class.return_value = mock_client
 
     # Call function
-    report, citations = fetch_perplexity_deep_research(
+    report, citations = await fetch_perplexity_deep_research(
         query="What is Python?",
         api_key="test_key",  # pragma: allowlist secret
     )
@@ -62,20 +80,18 @@ def test_fetch_perplexity_deep_research_empty_response(mock_perplexity_class):
 
 
 @pytest.mark.unit
-@patch("clients.perplexity_client.Perplexity")
-def test_fetch_perplexity_deep_research_api_error(mock_perplexity_class):
+@pytest.mark.asyncio
+@patch("perplexity.AsyncPerplexity")
+async def test_fetch_perplexity_deep_research_api_error(mock_perplexity_class):
     """Test handling of API errors."""
     # Setup using factory - client raises exception
-    mock_client = PerplexityResponseFactory.client_with_response(
-        PerplexityResponseFactory.empty_response()
-    )
-    mock_client.chat.completions.create = lambda **kwargs: (_ for _ in ()).throw(
+    mock_client = PerplexityResponseFactory.client_with_error(
         PerplexityResponseFactory.api_error()
     )
     mock_perplexity_class.return_value = mock_client
 
     # Call function
-    report, citations = fetch_perplexity_deep_research(
+    report, citations = await fetch_perplexity_deep_research(
         query="What is Python?",
         api_key="test_key",  # pragma: allowlist secret
     )
@@ -86,8 +102,9 @@ def test_fetch_perplexity_deep_research_api_error(mock_perplexity_class):
 
 
 @pytest.mark.unit
-@patch("clients.perplexity_client.Perplexity")
-def test_fetch_perplexity_deep_research_max_results_limit(mock_perplexity_class):
+@pytest.mark.asyncio
+@patch("perplexity.AsyncPerplexity")
+async def test_fetch_perplexity_deep_research_max_results_limit(mock_perplexity_class):
     """Test that max_results limits citations returned."""
     # Setup using factory with many citations
     response = PerplexityResponseFactory.with_many_citations(num_citations=5)
@@ -95,7 +112,7 @@ def test_fetch_perplexity_deep_research_max_results_limit(mock_perplexity_class)
     mock_perplexity_class.return_value = mock_client
 
     # Call function with max_results=2
-    report, citations = fetch_perplexity_deep_research(
+    report, citations = await fetch_perplexity_deep_research(
         query="Test query",
         api_key="test_key",  # pragma: allowlist secret
         max_results=2,
@@ -107,8 +124,9 @@ def test_fetch_perplexity_deep_research_max_results_limit(mock_perplexity_class)
 
 
 @pytest.mark.unit
-@patch("clients.perplexity_client.Perplexity")
-def test_fetch_perplexity_deep_research_no_citations(mock_perplexity_class):
+@pytest.mark.asyncio
+@patch("perplexity.AsyncPerplexity")
+async def test_fetch_perplexity_deep_research_no_citations(mock_perplexity_class):
     """Test handling when API returns no citations."""
     # Setup using factory without citations
     response = PerplexityResponseFactory.without_citations()
@@ -116,7 +134,7 @@ def test_fetch_perplexity_deep_research_no_citations(mock_perplexity_class):
     mock_perplexity_class.return_value = mock_client
 
     # Call function
-    report, citations = fetch_perplexity_deep_research(
+    report, citations = await fetch_perplexity_deep_research(
         query="Test query",
         api_key="test_key",  # pragma: allowlist secret
     )
@@ -124,3 +142,98 @@ def test_fetch_perplexity_deep_research_no_citations(mock_perplexity_class):
     # Assertions
     assert report == "Research without citations"
     assert citations == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("perplexity.AsyncPerplexity")
+async def test_fetch_perplexity_deep_research_reuses_client(mock_perplexity_class):
+    """Test that repeated calls with the same key share one client."""
+    # Setup using factory
+    response = PerplexityResponseFactory.successful_research()
+    mock_client = PerplexityResponseFactory.client_with_response(response)
+    mock_perplexity_class.return_value = mock_client
+
+    # Call function twice
+    for _ in range(2):
+        await fetch_perplexity_deep_research(
+            query="What is Python?",
+            api_key="test_key",  # pragma: allowlist secret
+        )
+
+    # Assertions - the client is only constructed once
+    mock_perplexity_class.assert_called_once()
+
+
+@pytest.mark.unit
+@patch("perplexity.AsyncPerplexity")
+def test_client_cache_is_bounded(mock_perplexity_class):
+    """Test that clients for many distinct keys don't accumulate forever."""
+    # Call function with more keys than the cache holds
+    for i in range(PERPLEXITY_CLIENTS.max_entries + 5):
+        get_perplexity_client(f"key-{i}")
+
+    # Assertions - only the most recent keys keep a client
+    assert len(PERPLEXITY_CLIENTS) == PERPLEXITY_CLIENTS.max_entries
+    assert PERPLEXITY_CLIENTS.get("key-0") is None
+
+
+@pytest.mark.unit
+def test_importing_client_does_not_load_sdk():
+    """Test that the Perplexity SDK is only imported on first use."""
+    # Import the client module in a fresh interpreter
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, clients.perplexity_client; "
+            "print('perplexity' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[3],
+    )
+
+    # Assertions
+    assert completed.stdout.strip() == "False"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("perplexity.AsyncPerplexity")
+async def test_fetch_perplexity_deep_research_skips_citations_without_url(
+    mock_perplexity_class,
+):
+    """Test that citation objects without a URL don't use up result slots."""
+    # Setup using factory with mixed citation shapes
+    response = PerplexityResponseFactory.successful_research(
+        citations=[{"title": "No link"}, {"url": "https://a.com"}, "https://b.com"]
+    )
+    mock_perplexity_class.return_value = PerplexityResponseFactory.client_with_response(
+        response
+    )
+
+    # Call function
+    report, citations = await fetch_perplexity_deep_research(
+        query="Test query",
+        api_key="test_key",  # pragma: allowlist secret
+        max_results=2,
+    )
+
+    # Assertions
+    assert citations == ["https://a.com", "https://b.com"]
+
+
+@pytest.mark.unit
+def test_research_system_message_is_not_shared_between_calls():
+    """Test that mutating one system message can't leak into later requests."""
+    # Build the message twice for the same value, mutating the first
+    first = research_system_message(3)
+    first["content"] = "mutated"
+    second = research_system_message(3)
+
+    # Assertions
+    assert second is not first
+    assert second["role"] == "system"
+    assert second["content"].endswith("Focus on returning 3 most relevant sources.")
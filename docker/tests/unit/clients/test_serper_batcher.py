@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for the Serper batcher."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from clients.serper_batcher import SerperBatcher
+from tests.builders.api_search_result_builder import an_api_search_result
+
+
+def _results_named_after_queries(queries, api_key):
+    """Answer each batched query with one result titled after the query."""
+    return [[an_api_search_result().with_title(query).build()] for query, _ in queries]
+
+
+class TestSerperBatcher:
+    """Tests for SerperBatcher."""
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_batcher.afetch_search_results_batch")
+    async def test_concurrent_searches_share_one_request(self, mock_batch):
+        # Arrange
+        mock_batch.side_effect = _results_named_after_queries
+        batcher = SerperBatcher(window_seconds=0.01)
+
+        # Act
+        first, second = await asyncio.gather(
+            batcher.search("first", "key"), batcher.search("second", "key", 3)
+        )
+
+        # Assert
+        mock_batch.assert_called_once_with([("first", 5), ("second", 3)], "key")
+        assert first[0].title == "first"
+        assert second[0].title == "second"
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_batcher.afetch_search_results_batch")
+    async def test_full_batch_is_sent_without_waiting_for_window(self, mock_batch):
+        # Arrange
+        mock_batch.side_effect = _results_named_after_queries
+        batcher = SerperBatcher(window_seconds=60, max_batch_size=2)
+
+        # Act
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.search("a", "key"), batcher.search("b", "key")),
+            timeout=1,
+        )
+
+        # Assert
+        assert [r[0].title for r in results] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_batcher.afetch_search_results_batch")
+    async def test_batches_are_separated_by_api_key(self, mock_batch):
+        # Arrange
+        mock_batch.side_effect = _results_named_after_queries
+        batcher = SerperBatcher(window_seconds=0.01)
+
+        # Act
+        await asyncio.gather(batcher.search("a", "key-1"), batcher.search("b", "key-2"))
+
+        # Assert
+        assert mock_batch.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_batcher.afetch_search_results_batch")
+    async def test_failed_batch_fails_every_search(self, mock_batch):
+        # Arrange
+        mock_batch.side_effect = RuntimeError("upstream down")
+        batcher = SerperBatcher(window_seconds=0.01)
+
+        # Act
+        results = await asyncio.gather(
+            batcher.search("a", "key"),
+            batcher.search("b", "key"),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_batcher.afetch_search_results_batch")
+    async def test_searches_missing_from_response_get_no_results(self, mock_batch):
+        # Arrange
+        mock_batch.side_effect = lambda queries, api_key: [
+            [an_api_search_result().with_title("a").build()]
+        ]
+        batcher = SerperBatcher(window_seconds=0.01)
+
+        # Act
+        first, second = await asyncio.wait_for(
+            asyncio.gather(batcher.search("a", "key"), batcher.search("b", "key")),
+            timeout=1,
+        )
+
+        # Assert
+        assert first[0].title == "a"
+        assert second == []
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_batcher.afetch_search_results_batch")
+    async def test_keeps_in_flight_sends_referenced(self, mock_batch):
+        # Arrange
+        mock_batch.side_effect = _results_named_after_queries
+        batcher = SerperBatcher(window_seconds=60, max_batch_size=1)
+
+        # Act
+        search = asyncio.ensure_future(batcher.search("a", "key"))
+        await asyncio.sleep(0)
+        in_flight = len(batcher._sends)
+        await search
+
+        # Assert
+        assert in_flight == 1
+        assert len(batcher._sends) == 0
@@ -5,72 +5,275 @@
 
 """Unit tests for Serper client."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
-from clients.serper_client import fetch_search_results
+import httpx
+import pytest
+
+from clients.serper_client import (
+    SCRAPED_PAGES_CACHE,
+    _text_from_prefix,
+    afetch_search_results,
+    afetch_search_results_batch,
+    scrape_webpage,
+)
+from constants import (
+    SERPER_ATTEMPT_TIMEOUT_SECONDS,
+    SERPER_ATTEMPTS,
+    SERPER_TIMEOUT_SECONDS,
+)
 from tests.factories.serper_response_factory import SerperResponseFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_serper_caches():
+    """Start every test with an empty scrape cache."""
+    SCRAPED_PAGES_CACHE.clear()
+    yield
+    SCRAPED_PAGES_CACHE.clear()
+
+
 class TestSerperClient:
     """Tests for Serper API client."""
 
-    @patch("clients.serper_client.requests.post")
-    def test_returns_search_results_from_organic(self, mock_post):
+    @patch("clients.serper_client.HTTP_SESSION.post")
+    def test_repeat_scrape_is_served_from_cache(self, mock_post):
         # Arrange
-        mock_post.return_value = SerperResponseFactory.two_results()
+        mock_post.return_value = SerperResponseFactory.scrape("# Page")
+        scrape_webpage("https://example.com", "fake_api_key")
 
         # Act
-        results = fetch_search_results("test query", "fake_api_key")
+        content = scrape_webpage("https://example.com", "fake_api_key")
 
         # Assert
-        assert len(results) == 2
-        assert results[0].title == "Result 1"
-        assert results[0].link == "https://example.com/1"
-        assert results[1].title == "Result 2"
+        assert content == "# Page"
+        mock_post.assert_called_once()
 
-    @patch("clients.serper_client.requests.post")
-    def test_returns_empty_when_no_organic_results(self, mock_post):
+    @patch("clients.serper_client.SCRAPE_MAX_RESPONSE_BYTES", 64)
+    @patch("clients.serper_client.HTTP_SESSION.post")
+    def test_scrape_keeps_text_from_oversized_response(self, mock_post):
         # Arrange
-        mock_post.return_value = SerperResponseFactory.empty()
+        response = SerperResponseFactory.scrape("x" * 1000)
+        mock_post.return_value = response
 
         # Act
-        results = fetch_search_results("test query", "fake_api_key")
+        content = scrape_webpage("https://example.com/huge", "fake_api_key")
 
         # Assert
-        assert len(results) == 0
+        assert content and set(content) == {"x"}
+        assert len(content) < 100
+        assert response.closed
+        assert mock_post.call_args[1]["stream"] is True
 
-    @patch("clients.serper_client.requests.post")
-    def test_handles_request_exception(self, mock_post):
+    def test_text_prefix_drops_escape_split_by_the_cut(self):
         # Arrange
-        mock_post.side_effect = Exception("Network error")
+        body = b'{"text": "caf\\u00e9 au lait \\u00e'
 
         # Act
-        results = fetch_search_results("test query", "fake_api_key")
+        text = _text_from_prefix(body)
 
         # Assert
-        assert len(results) == 0
+        assert text == "café au lait "
 
-    @patch("clients.serper_client.requests.post")
-    def test_uses_correct_api_endpoint(self, mock_post):
+    def test_text_prefix_returns_complete_text_when_later_fields_are_cut(self):
         # Arrange
-        mock_post.return_value = SerperResponseFactory.empty()
+        body = b'{"text": "full page", "metadata": {"title": "Pa'
+
+        # Act
+        text = _text_from_prefix(body)
+
+        # Assert
+        assert text == "full page"
+
+    @patch("clients.serper_client.MAX_CONTENT_LENGTH", 10)
+    @patch("clients.serper_client.HTTP_SESSION.post")
+    def test_scrape_caps_text_at_max_content_length(self, mock_post):
+        # Arrange
+        mock_post.return_value = SerperResponseFactory.scrape("x" * 50)
+
+        # Act
+        content = scrape_webpage("https://example.com/long", "fake_api_key")
+
+        # Assert
+        assert content == "x" * 10
+
+
+class TestAsyncSerperClient:
+    """Tests for the async Serper API client."""
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_returns_search_results_from_organic(self, mock_post):
+        # Arrange
+        mock_post.return_value = SerperResponseFactory.two_results()
 
         # Act
-        fetch_search_results("test query", "fake_api_key")
+        results = await afetch_search_results("test query", "fake_api_key")
 
         # Assert
+        assert [r.title for r in results] == ["Result 1", "Result 2"]
         assert mock_post.call_args[0][0] == "https://google.serper.dev/search"
+        assert mock_post.call_args[1]["json"] == {"q": "test query", "num": 5}
 
-    @patch("clients.serper_client.requests.post")
-    def test_handles_missing_fields_with_defaults(self, mock_post):
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_returns_empty_when_no_organic_results(self, mock_post):
+        # Arrange
+        mock_post.return_value = SerperResponseFactory.empty()
+
+        # Act
+        results = await afetch_search_results("test query", "fake_api_key")
+
+        # Assert
+        assert results == []
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_handles_missing_fields_with_defaults(self, mock_post):
         # Arrange
         mock_post.return_value = SerperResponseFactory.with_results([{}])
 
         # Act
-        results = fetch_search_results("test query", "fake_api_key")
+        results = await afetch_search_results("test query", "fake_api_key")
 
         # Assert
         assert len(results) == 1
         assert results[0].title == "Untitled"
         assert results[0].link == ""
         assert results[0].snippet == ""
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_limits_results_to_max_results(self, mock_post):
+        # Arrange
+        mock_post.return_value = SerperResponseFactory.two_results()
+
+        # Act
+        results = await afetch_search_results(
+            "test query", "fake_api_key", max_results=1
+        )
+
+        # Assert
+        assert len(results) == 1
+        assert results[0].title == "Result 1"
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_raises_request_exception(self, mock_post):
+        # Arrange
+        mock_post.side_effect = Exception("Network error")
+
+        # Act / Assert
+        with pytest.raises(Exception, match="Network error"):
+            await afetch_search_results("test query", "fake_api_key")
+
+    @pytest.mark.asyncio
+    @patch("utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_retries_transient_connection_errors(self, mock_post, mock_sleep):
+        # Arrange
+        mock_post.side_effect = [
+            httpx.ConnectError("connection reset"),
+            SerperResponseFactory.two_results(),
+        ]
+
+        # Act
+        results = await afetch_search_results("test query", "fake_api_key")
+
+        # Assert
+        assert len(results) == 2
+        assert mock_post.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_retries_read_timeouts_with_a_per_attempt_timeout(
+        self, mock_post, mock_sleep
+    ):
+        # Arrange
+        mock_post.side_effect = [
+            httpx.ReadTimeout("slow upstream"),
+            SerperResponseFactory.two_results(),
+        ]
+
+        # Act
+        results = await afetch_search_results("test query", "fake_api_key")
+
+        # Assert
+        assert len(results) == 2
+        assert mock_post.call_args[1]["timeout"] == SERPER_ATTEMPT_TIMEOUT_SECONDS
+
+    def test_overall_budget_covers_every_attempt(self):
+        # Assert
+        assert SERPER_TIMEOUT_SECONDS > SERPER_ATTEMPTS * SERPER_ATTEMPT_TIMEOUT_SECONDS
+
+    @pytest.mark.asyncio
+    @patch("utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_does_not_retry_client_errors(self, mock_post, mock_sleep):
+        # Arrange
+        request = httpx.Request("POST", "https://google.serper.dev/search")
+        mock_post.side_effect = httpx.HTTPStatusError(
+            "401 Unauthorized",
+            request=request,
+            response=httpx.Response(401, request=request),
+        )
+
+        # Act
+        with pytest.raises(httpx.HTTPStatusError):
+            await afetch_search_results("test query", "bad_api_key")
+
+        # Assert
+        assert mock_post.await_count == 1
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_batch_returns_results_per_query(self, mock_post):
+        # Arrange
+        mock_post.return_value = SerperResponseFactory.batch(
+            SerperResponseFactory.two_results(), SerperResponseFactory.empty()
+        )
+
+        # Act
+        results = await afetch_search_results_batch(
+            [("first", 1), ("second", 5)], "fake_api_key"
+        )
+
+        # Assert
+        assert [len(r) for r in results] == [1, 0]
+        assert mock_post.call_args[1]["json"] == [
+            {"q": "first", "num": 1},
+            {"q": "second", "num": 5},
+        ]
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_batch_failure_raises(self, mock_post):
+        # Arrange
+        mock_post.side_effect = Exception("Network error")
+
+        # Act / Assert
+        with pytest.raises(Exception, match="Network error"):
+            await afetch_search_results_batch([("a", 5), ("b", 5)], "key")
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_batch_rejects_short_response(self, mock_post):
+        # Arrange
+        mock_post.return_value = SerperResponseFactory.batch(
+            SerperResponseFactory.two_results()
+        )
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="malformed batch response"):
+            await afetch_search_results_batch([("a", 5), ("b", 5)], "key")
+
+    @pytest.mark.asyncio
+    @patch("clients.serper_client.ASYNC_HTTP_CLIENT.post", new_callable=AsyncMock)
+    async def test_batch_rejects_non_list_response(self, mock_post):
+        # Arrange
+        mock_post.return_value = SerperResponseFactory.two_results()
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="malformed batch response"):
+            await afetch_search_results_batch([("a", 5), ("b", 5)], "key")
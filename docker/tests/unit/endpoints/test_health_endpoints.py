@@ -0,0 +1,40 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for health and status endpoints."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from endpoints.health_endpoints import setup_health_endpoints
+from models.responses.health_responses import get_root_info
+
+
+def a_client() -> TestClient:
+    """Create a test client for an app with the health endpoints."""
+    app = FastAPI()
+    setup_health_endpoints(app)
+    return TestClient(app)
+
+
+class TestHealthEndpoints:
+    """Tests for the endpoints registered by setup_health_endpoints."""
+
+    def test_root_serves_precomputed_info(self):
+        # Act
+        response = a_client().get("/")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == get_root_info()
+
+    def test_health_reports_healthy(self):
+        # Act
+        response = a_client().get("/health")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
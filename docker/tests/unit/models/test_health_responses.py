@@ -0,0 +1,25 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for health response formatters."""
+
+from models.responses.health_responses import (
+    SERVER_CONFIGURATION,
+    get_server_configuration,
+)
+
+
+class TestGetServerConfiguration:
+    """Tests for get_server_configuration."""
+
+    def test_returns_copy_of_startup_configuration(self):
+        # Act
+        config = get_server_configuration()
+        config["port"] = -1
+
+        # Assert
+        assert get_server_configuration() == SERVER_CONFIGURATION
+        assert SERVER_CONFIGURATION["port"] != -1
+        assert set(config) == {"serper_api_configured", "port", "log_level", "log_dir"}
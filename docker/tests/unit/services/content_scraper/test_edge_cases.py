@@ -5,6 +5,7 @@
 
 """Unit tests for edge cases and boundary conditions."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from constants import MAX_CONTENT_LENGTH
@@ -17,7 +18,7 @@ class TestContentScraperEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
     @patch("services.content_scraper.trafilatura.extract")
-    @patch("services.content_scraper.requests.get")
+    @patch("services.content_scraper.HTTP_SESSION.get")
     def test_truncates_content_exceeding_max_length(self, mock_get, mock_trafilatura):
         # Arrange - content larger than MAX_CONTENT_LENGTH to trigger truncation
         large_content = (
@@ -36,7 +37,31 @@ class TestContentScraperEdgeCases:
         assert "[content truncated]" in scraped.content
         assert len(scraped.content) <= MAX_CONTENT_LENGTH + 100  # Some buffer
 
-    @patch("services.content_scraper.requests.get")
+    @patch("services.content_scraper.HTTP_SESSION.get")
+    def test_extracts_in_parse_pool_when_enabled(self, mock_get):
+        # Arrange - a thread pool stands in for the process pool (same API)
+        html = (
+            "<html><body><article>"
+            + ("<p>Body text.</p>" * 50)
+            + "</article></body></html>"
+        )
+        result = a_search_result().build()
+        mock_get.return_value = HttpResponseFactory.success(content=html)
+        pool = ThreadPoolExecutor(max_workers=1)
+
+        # Act
+        with (
+            patch("services.content_scraper.PARSE_POOL", pool),
+            patch.object(pool, "submit", wraps=pool.submit) as mock_submit,
+        ):
+            scraped = scrape_search_result(result)
+        pool.shutdown()
+
+        # Assert
+        mock_submit.assert_called_once()
+        assert "Body text." in scraped.content
+
+    @patch("services.content_scraper.HTTP_SESSION.get")
     def test_handles_connection_error(self, mock_get):
         # Arrange
         result = a_search_result().build()
@@ -47,8 +72,9 @@ class TestContentScraperEdgeCases:
 
         # Assert
         assert "Error: Failed to retrieve" in scraped.content
+        assert scraped.scrape_failed is True
 
-    @patch("services.content_scraper.requests.get")
+    @patch("services.content_scraper.HTTP_SESSION.get")
     def test_handles_readability_failure_with_fallback(self, mock_get):
         # Arrange - malformed HTML that readability might reject
         bad_html = "<html><body><<<<>>>>>nonsense</body></html>"
@@ -15,7 +15,7 @@ from tests.factories.http_response_factory import HttpResponseFactory
 class TestContentScraperErrors:
     """Tests for error handling in content scraping."""
 
-    @patch("services.content_scraper.requests.get")
+    @patch("services.content_scraper.HTTP_SESSION.get")
     def test_returns_error_message_on_404(self, mock_get):
         # Arrange
         result = a_search_result().build()
@@ -27,7 +27,7 @@ class TestContentScraperErrors:
         # Assert
         assert "Error: Failed to retrieve" in scraped.content
 
-    @patch("services.content_scraper.requests.get")
+    @patch("services.content_scraper.HTTP_SESSION.get")
     def test_returns_error_message_on_timeout(self, mock_get):
         # Arrange
         result = a_search_result().build()
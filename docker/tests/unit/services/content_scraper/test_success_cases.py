@@ -7,15 +7,25 @@
 
 from unittest.mock import patch
 
-from services.content_scraper import scrape_search_result
+import pytest
+
+from services.content_scraper import REVALIDATION_CACHE, scrape_search_result
 from tests.builders.search_result_builder import a_search_result
 from tests.factories.http_response_factory import HttpResponseFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_revalidation_cache():
+    """Start every test without remembered page validators."""
+    REVALIDATION_CACHE.clear()
+    yield
+    REVALIDATION_CACHE.clear()
+
+
 class TestContentScraperSuccess:
     """Tests for successful content scraping scenarios."""
 
-    @patch("services.content_scraper.requests.get")
+    @patch("services.content_scraper.HTTP_SESSION.get")
     def test_converts_html_to_markdown_with_title(self, mock_get):
         # Arrange
         result = a_search_result().with_title("Test Article").build()
@@ -28,7 +38,7 @@ class TestContentScraperSuccess:
         assert scraped.content.startswith("# Test Article")
         assert "*Source: https://example.com/test*" in scraped.content
 
-    @patch("services.content_scraper.requests.get")
+    @patch("services.content_scraper.HTTP_SESSION.get")
     def test_wraps_plaintext_in_code_blocks(self, mock_get):
         # Arrange
         result = a_search_result().build()
@@ -41,7 +51,7 @@ class TestContentScraperSuccess:
         assert "```" in scraped.content
         assert "Plain text content" in scraped.content
 
-    @patch("services.content_scraper.requests.get")
+    @patch("services.content_scraper.HTTP_SESSION.get")
     def test_handles_pdf_files_with_message(self, mock_get):
         # Arrange
         result = a_search_result().build()
@@ -53,3 +63,23 @@ class TestContentScraperSuccess:
         # Assert
         assert "binary file" in scraped.content
         assert "application/pdf" in scraped.content
+
+    @patch("services.content_scraper.trafilatura.extract")
+    @patch("services.content_scraper.HTTP_SESSION.get")
+    def test_reuses_extraction_when_page_not_modified(self, mock_get, mock_extract):
+        # Arrange
+        result = a_search_result().build()
+        mock_extract.return_value = "Article body " * 20
+        mock_get.side_effect = [
+            HttpResponseFactory.success(headers={"ETag": '"v1"'}),
+            HttpResponseFactory.not_modified(),
+        ]
+        scrape_search_result(result)
+
+        # Act
+        scraped = scrape_search_result(a_search_result().build())
+
+        # Assert
+        assert "Article body" in scraped.content
+        mock_extract.assert_called_once()
+        assert mock_get.call_args[1]["headers"]["If-None-Match"] == '"v1"'
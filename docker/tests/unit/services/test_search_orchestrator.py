@@ -0,0 +1,378 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for search orchestrator."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services.search_orchestrator import (
+    SEARCH_CACHE,
+    SEARCH_INFLIGHT,
+    SERPER_BREAKER,
+    execute_cached_search,
+    execute_search,
+    fetch_hedged,
+    fetch_with_serper,
+    process_and_format_results,
+    search_duckduckgo,
+)
+from tests.builders.api_search_result_builder import (
+    a_duckduckgo_result,
+    a_serper_result,
+)
+
+
+def _record_thread_name(*args):
+    """Return the name of the worker thread the call ran on."""
+    return [threading.current_thread().name]
+
+
+@pytest.fixture(autouse=True)
+def reset_serper_breaker():
+    """Start every test with a closed Serper circuit."""
+    SERPER_BREAKER.reset()
+    yield
+    SERPER_BREAKER.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Start every test with an empty search cache."""
+    SEARCH_CACHE.clear()
+    yield
+    SEARCH_CACHE.clear()
+
+
+class TestSearchOrchestratorPools:
+    """Tests for where search and scrape work runs."""
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.fetch_duckduckgo_search_results")
+    async def test_duckduckgo_runs_on_search_pool(self, mock_ddg):
+        # Arrange
+        mock_ddg.side_effect = _record_thread_name
+
+        # Act
+        results, source = await search_duckduckgo("query")
+
+        # Assert
+        assert source == "DuckDuckGo (free fallback)"
+        assert results[0].startswith("webcat-search")
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_serper_is_awaited_on_the_event_loop(self, mock_serper):
+        # Arrange
+        mock_serper.side_effect = lambda query, api_key, max_results: (
+            _record_thread_name()
+        )
+
+        # Act
+        results, source = await fetch_with_serper("query", "fake_key")
+
+        # Assert
+        assert source == "Serper API"
+        assert results[0] == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.scrape_search_result")
+    async def test_scraping_runs_on_scrape_pool(self, mock_scrape):
+        # Arrange
+        def scrape(search_result):
+            search_result.content = threading.current_thread().name
+            return search_result
+
+        mock_scrape.side_effect = scrape
+
+        # Act
+        result = await process_and_format_results(
+            [a_serper_result().build()], "query", "Serper API"
+        )
+
+        # Assert
+        assert result["results"][0]["content"].startswith("webcat-scrape")
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.scrape_search_result")
+    async def test_failed_scrape_does_not_fail_other_results(self, mock_scrape):
+        # Arrange
+        def scrape(search_result):
+            if search_result.url == "https://bad.example.com":
+                raise RuntimeError("boom")
+            search_result.content = "Scraped"
+            return search_result
+
+        mock_scrape.side_effect = scrape
+        results = [
+            a_serper_result().with_link("https://bad.example.com").build(),
+            a_serper_result().with_link("https://good.example.com").build(),
+        ]
+
+        # Act
+        result = await process_and_format_results(results, "query", "Serper API")
+
+        # Assert
+        contents = [r["content"] for r in result["results"]]
+        assert contents[0] == "Error: Failed to scrape content. boom"
+        assert contents[1] == "Scraped"
+
+
+class TestFetchHedged:
+    """Tests for racing Serper against DuckDuckGo."""
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.fetch_duckduckgo_search_results")
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_prefers_serper_when_it_returns_results(self, mock_serper, mock_ddg):
+        # Arrange
+        mock_serper.return_value = [a_serper_result().build()]
+        mock_ddg.side_effect = lambda query, max_results: time.sleep(0.2) or [
+            a_duckduckgo_result().build()
+        ]
+
+        # Act
+        results, source = await fetch_hedged("query", "fake_key")
+
+        # Assert
+        assert source == "Serper API"
+        assert results[0].title == "Serper Result"
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.fetch_duckduckgo_search_results")
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_uses_duckduckgo_when_serper_is_empty(self, mock_serper, mock_ddg):
+        # Arrange
+        mock_serper.return_value = []
+        mock_ddg.return_value = [a_duckduckgo_result().build()]
+
+        # Act
+        results, source = await fetch_hedged("query", "fake_key")
+
+        # Assert
+        assert source == "DuckDuckGo (free fallback)"
+        assert results[0].title == "DuckDuckGo Result"
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.HEDGE_ENABLED", True)
+    @patch("services.search_orchestrator.process_and_format_results")
+    @patch("services.search_orchestrator.fetch_duckduckgo_search_results")
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_execute_search_does_not_retry_duckduckgo_after_hedge(
+        self, mock_serper, mock_ddg, mock_format
+    ):
+        # Arrange
+        mock_serper.return_value = []
+        mock_ddg.return_value = []
+
+        # Act
+        result = await execute_search("query", "fake_key")
+
+        # Assert
+        assert result["error"] == "No search results found from any source."
+        mock_ddg.assert_called_once_with("query", 5)
+        mock_format.assert_not_called()
+
+
+class TestSerperCircuitBreaker:
+    """Tests for skipping Serper while its circuit is open."""
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_skips_serper_once_circuit_opens(self, mock_serper):
+        # Arrange
+        mock_serper.side_effect = Exception("Network error")
+        for _ in range(SERPER_BREAKER.failure_threshold):
+            await fetch_with_serper("query", "fake_key")
+
+        # Act
+        results, source = await fetch_with_serper("query", "fake_key")
+
+        # Assert
+        assert results == []
+        assert source == "Serper API"
+        assert mock_serper.call_count == SERPER_BREAKER.failure_threshold
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_empty_responses_do_not_open_circuit(self, mock_serper):
+        # Arrange
+        mock_serper.return_value = []
+        for _ in range(SERPER_BREAKER.failure_threshold):
+            await fetch_with_serper("query", "fake_key")
+
+        # Act
+        await fetch_with_serper("query", "fake_key")
+
+        # Assert
+        assert SERPER_BREAKER.failure_count == 0
+        assert mock_serper.call_count == SERPER_BREAKER.failure_threshold + 1
+
+
+class TestUpstreamConcurrencyLimits:
+    """Tests for the per-upstream concurrency caps."""
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_serper_calls_beyond_the_limit_wait_for_a_slot(self, mock_serper):
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def search(query, api_key, max_results):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [a_serper_result().build()]
+
+        mock_serper.side_effect = search
+
+        # Act
+        with patch("services.search_orchestrator.SERPER_LIMIT", asyncio.Semaphore(2)):
+            outcomes = await asyncio.gather(
+                *[fetch_with_serper(f"query {i}", "fake_key") for i in range(5)]
+            )
+
+        # Assert
+        assert peak == 2
+        assert all(results for results, _ in outcomes)
+
+
+class TestExecuteSearch:
+    """Tests for execute_search."""
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.process_and_format_results")
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_limits_results_before_scraping(self, mock_serper, mock_format):
+        # Arrange
+        mock_serper.return_value = [
+            a_serper_result().with_link(f"https://example.com/{i}").build()
+            for i in range(5)
+        ]
+        mock_format.return_value = {"results": []}
+
+        # Act
+        await execute_search("query", "fake_key", max_results=2)
+
+        # Assert
+        assert mock_serper.call_args[0] == ("query", "fake_key", 2)
+        scraped = mock_format.call_args[0][0]
+        assert [r.link for r in scraped] == [
+            "https://example.com/0",
+            "https://example.com/1",
+        ]
+
+
+class TestUpstreamTimeouts:
+    """Tests for the time budgets around blocking upstream calls."""
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.SERPER_TIMEOUT_SECONDS", 0.05)
+    @patch("services.search_orchestrator.afetch_search_results")
+    async def test_serper_timeout_returns_no_results(self, mock_serper):
+        # Arrange
+        async def slow_search(query, api_key, max_results):
+            await asyncio.sleep(0.3)
+            return [a_serper_result().build()]
+
+        mock_serper.side_effect = slow_search
+
+        # Act
+        results, source = await fetch_with_serper("query", "fake_key")
+
+        # Assert
+        assert results == []
+        assert source == "Serper API"
+        assert SERPER_BREAKER.failure_count == 1
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.SCRAPE_TIMEOUT_SECONDS", 0.05)
+    @patch("services.search_orchestrator.scrape_search_result")
+    async def test_scrape_timeout_becomes_error_entry(self, mock_scrape):
+        # Arrange
+        mock_scrape.side_effect = lambda search_result: time.sleep(0.3)
+
+        # Act
+        result = await process_and_format_results(
+            [a_serper_result().build()], "query", "Serper API"
+        )
+
+        # Assert
+        assert result["results"][0]["content"] == (
+            "Error: Scraping timed out after 0.05s."
+        )
+
+
+class TestExecuteCachedSearch:
+    """Tests for result caching and coalescing around execute_search."""
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.execute_search")
+    async def test_repeat_query_is_served_from_cache(self, mock_execute):
+        # Arrange
+        mock_execute.return_value = {"query": "q", "results": []}
+
+        # Act
+        first = await execute_cached_search("q")
+        second = await execute_cached_search("q")
+
+        # Assert
+        assert first == second
+        mock_execute.assert_called_once_with("q", "", 5)
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.execute_search")
+    async def test_cache_is_separated_by_api_key(self, mock_execute):
+        # Arrange
+        mock_execute.return_value = {"query": "q", "results": []}
+
+        # Act
+        await execute_cached_search("q", "key-1")
+        await execute_cached_search("q", "key-2")
+
+        # Assert
+        assert mock_execute.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.execute_search")
+    async def test_errors_are_not_cached(self, mock_execute):
+        # Arrange
+        mock_execute.return_value = {"error": "Search failed: boom", "query": "q"}
+
+        # Act
+        await execute_cached_search("q")
+        await execute_cached_search("q")
+
+        # Assert
+        assert mock_execute.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("services.search_orchestrator.execute_search")
+    async def test_concurrent_identical_queries_share_one_search(self, mock_execute):
+        # Arrange
+        async def slow_search(query, api_key, max_results):
+            await asyncio.sleep(0.05)
+            return {"query": query, "results": []}
+
+        mock_execute.side_effect = slow_search
+
+        # Act
+        results = await asyncio.gather(
+            execute_cached_search("q"),
+            execute_cached_search("q"),
+            execute_cached_search("q"),
+        )
+
+        # Assert
+        assert results[0] == results[1] == results[2]
+        mock_execute.assert_called_once()
+        assert len(SEARCH_INFLIGHT) == 0
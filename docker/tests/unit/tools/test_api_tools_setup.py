@@ -0,0 +1,240 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for API tool setup functions."""
+
+import importlib
+import sys
+import warnings
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from constants import CAPABILITIES, MAX_SEARCH_RESULTS, SERVICE_NAME, VERSION
+from models.responses.api_responses import APISearchToolResponse
+from tools.api_tools_setup import (
+    SCRAPE_CACHE,
+    create_webcat_functions,
+    setup_health_check_tool,
+    setup_scrape_tool,
+    setup_search_tool,
+    setup_server_info_tool,
+)
+
+
+class ToolRegistry:
+    """Stand-in for FastMCP that records the functions registered as tools."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, name, description):
+        def register(func):
+            self.tools[name] = func
+            return func
+
+        return register
+
+
+class TestCreateWebcatFunctions:
+    """Tests for the search wrapper created by create_webcat_functions."""
+
+    @pytest.mark.asyncio
+    @patch("tools.api_tools_setup.execute_cached_search")
+    async def test_search_goes_through_cached_search(self, mock_search):
+        # Arrange
+        mock_search.return_value = {"query": "q", "results": []}
+        search = create_webcat_functions()["search"]
+
+        # Act
+        result = await search("q", 3)
+
+        # Assert
+        assert result == {"query": "q", "results": []}
+        mock_search.assert_called_once_with("q", "", 3)
+
+
+class TestStaticToolResponses:
+    """Tests for tools that return precomputed responses."""
+
+    @pytest.mark.asyncio
+    async def test_server_info_returns_independent_copies(self):
+        # Arrange
+        registry = ToolRegistry()
+        setup_server_info_tool(registry)
+        get_server_info = registry.tools["get_server_info"]
+
+        # Act
+        first = await get_server_info()
+        first["features"].append("mutated")
+        second = await get_server_info()
+
+        # Assert
+        assert second["success"] is True
+        assert second["version"] == VERSION
+        assert second["server"] == SERVICE_NAME
+        assert second["features"] == list(CAPABILITIES)
+
+    @pytest.mark.asyncio
+    async def test_health_check_without_function_reports_healthy(self):
+        # Arrange
+        registry = ToolRegistry()
+        setup_health_check_tool(registry, None)
+
+        # Act
+        result = await registry.tools["health_check"]()
+
+        # Assert
+        assert result["success"] is True
+        assert result["status"] == "healthy"
+        assert result["service"] == "webcat"
+
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_recent_result(self):
+        # Arrange
+        registry = ToolRegistry()
+        health_func = AsyncMock(return_value={"status": "healthy", "service": "webcat"})
+        setup_health_check_tool(registry, health_func)
+        health_check = registry.tools["health_check"]
+
+        # Act
+        first = await health_check()
+        second = await health_check()
+
+        # Assert
+        assert first == second
+        assert first is not second
+        health_func.assert_awaited_once()
+
+
+class TestSearchTool:
+    """Tests for the search tool registered by setup_search_tool."""
+
+    @pytest.mark.asyncio
+    @patch.dict("os.environ", {}, clear=True)
+    async def test_passes_max_results_to_search_function(self):
+        # Arrange
+        registry = ToolRegistry()
+        search_func = AsyncMock(return_value={"search_source": "Serper API"})
+        setup_search_tool(registry, search_func)
+
+        # Act
+        result = await registry.tools["search"]("query", ctx=None, max_results=2)
+
+        # Assert
+        search_func.assert_called_once_with("query", 2)
+        assert result["success"] is True
+        assert result["search_source"] == "Serper API"
+
+    @pytest.mark.asyncio
+    @patch.dict("os.environ", {}, clear=True)
+    async def test_success_response_matches_model_dump(self):
+        # Arrange
+        registry = ToolRegistry()
+        results = [{"title": "T", "url": "https://a", "snippet": "", "content": ""}]
+        search_func = AsyncMock(
+            return_value={"search_source": "Serper API", "results": results}
+        )
+        setup_search_tool(registry, search_func)
+
+        # Act
+        result = await registry.tools["search"]("query", ctx=None, max_results=1)
+
+        # Assert
+        assert result == APISearchToolResponse.model_validate(result).model_dump()
+
+    @pytest.mark.asyncio
+    @patch.dict("os.environ", {}, clear=True)
+    async def test_clamps_max_results(self):
+        # Arrange
+        registry = ToolRegistry()
+        search_func = AsyncMock(return_value={"search_source": "Serper API"})
+        setup_search_tool(registry, search_func)
+
+        # Act
+        result = await registry.tools["search"]("query", ctx=None, max_results=500)
+
+        # Assert
+        search_func.assert_called_once_with("query", MAX_SEARCH_RESULTS)
+        assert result["max_results"] == MAX_SEARCH_RESULTS
+
+
+class TestScrapeTool:
+    """Tests for the scrape tool registered by setup_scrape_tool."""
+
+    @pytest.fixture(autouse=True)
+    def clear_scrape_cache(self):
+        """Start every test with an empty scrape cache."""
+        SCRAPE_CACHE.clear()
+        yield
+        SCRAPE_CACHE.clear()
+
+    @staticmethod
+    def _scrape(search_result, content, scrape_failed=False):
+        search_result.content = content
+        search_result.scrape_failed = scrape_failed
+        return search_result
+
+    @pytest.mark.asyncio
+    @patch("tools.api_tools_setup.scrape_search_result")
+    async def test_successful_scrape_is_cached(self, mock_scrape):
+        # Arrange
+        registry = ToolRegistry()
+        setup_scrape_tool(registry)
+        mock_scrape.side_effect = lambda result: self._scrape(result, "# Page")
+
+        # Act
+        await registry.tools["scrape_url"]("https://example.com")
+        result = await registry.tools["scrape_url"]("https://example.com")
+
+        # Assert
+        assert result["content"] == "# Page"
+        assert "scrape_failed" not in result
+        mock_scrape.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("tools.api_tools_setup.scrape_search_result")
+    async def test_snippet_fallback_is_not_cached(self, mock_scrape):
+        # Arrange
+        registry = ToolRegistry()
+        setup_scrape_tool(registry)
+        mock_scrape.side_effect = lambda result: self._scrape(
+            result, "(Full content extraction failed - only snippet available)", True
+        )
+
+        # Act
+        await registry.tools["scrape_url"]("https://example.com")
+        await registry.tools["scrape_url"]("https://example.com")
+
+        # Assert
+        assert mock_scrape.call_count == 2
+
+
+class TestDeprecatedApiToolsModule:
+    """Tests for the lazy api_tools compatibility shim."""
+
+    def test_import_does_not_warn_until_attribute_access(self):
+        # Arrange
+        sys.modules.pop("api_tools", None)
+
+        # Act
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            api_tools = importlib.import_module("api_tools")
+            import_warnings = list(caught)
+            func = api_tools.create_webcat_functions
+
+        # Assert
+        assert import_warnings == []
+        assert func is create_webcat_functions
+        assert any(issubclass(w.category, DeprecationWarning) for w in caught)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        # Arrange
+        import api_tools
+
+        # Act & Assert
+        with pytest.raises(AttributeError):
+            api_tools.not_a_real_name
@@ -5,7 +5,8 @@
 
 """Unit tests for deep_research_tool."""
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -15,7 +16,9 @@ from tools.deep_research_tool import deep_research_tool
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch("tools.deep_research_tool.PERPLEXITY_API_KEY", "test_key")
-@patch("tools.deep_research_tool.fetch_perplexity_deep_research")
+@patch(
+    "tools.deep_research_tool.fetch_perplexity_deep_research", new_callable=AsyncMock
+)
 async def test_deep_research_tool_success(mock_fetch):
     """Test successful deep research."""
     # Setup mock
@@ -64,7 +67,9 @@ async def test_deep_research_tool_no_api_key():
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch("tools.deep_research_tool.PERPLEXITY_API_KEY", "test_key")
-@patch("tools.deep_research_tool.fetch_perplexity_deep_research")
+@patch(
+    "tools.deep_research_tool.fetch_perplexity_deep_research", new_callable=AsyncMock
+)
 async def test_deep_research_tool_empty_response(mock_fetch):
     """Test deep research when API returns empty response."""
     # Setup mock to return empty
@@ -82,7 +87,9 @@ async def test_deep_research_tool_empty_response(mock_fetch):
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch("tools.deep_research_tool.PERPLEXITY_API_KEY", "test_key")
-@patch("tools.deep_research_tool.fetch_perplexity_deep_research")
+@patch(
+    "tools.deep_research_tool.fetch_perplexity_deep_research", new_callable=AsyncMock
+)
 async def test_deep_research_tool_default_params(mock_fetch):
     """Test deep research with default parameters."""
     # Setup mock
@@ -106,7 +113,9 @@ async def test_deep_research_tool_default_params(mock_fetch):
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch("tools.deep_research_tool.PERPLEXITY_API_KEY", "test_key")
-@patch("tools.deep_research_tool.fetch_perplexity_deep_research")
+@patch(
+    "tools.deep_research_tool.fetch_perplexity_deep_research", new_callable=AsyncMock
+)
 async def test_deep_research_tool_custom_effort_levels(mock_fetch):
     """Test deep research with different effort levels."""
     mock_fetch.return_value = ("Report", [])
@@ -127,7 +136,9 @@ async def test_deep_research_tool_custom_effort_levels(mock_fetch):
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch("tools.deep_research_tool.PERPLEXITY_API_KEY", "test_key")
-@patch("tools.deep_research_tool.fetch_perplexity_deep_research")
+@patch(
+    "tools.deep_research_tool.fetch_perplexity_deep_research", new_callable=AsyncMock
+)
 async def test_deep_research_tool_no_citations(mock_fetch):
     """Test deep research when no citations are returned."""
     # Setup mock with no citations
@@ -145,7 +156,9 @@ async def test_deep_research_tool_no_citations(mock_fetch):
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch("tools.deep_research_tool.PERPLEXITY_API_KEY", "test_key")
-@patch("tools.deep_research_tool.fetch_perplexity_deep_research")
+@patch(
+    "tools.deep_research_tool.fetch_perplexity_deep_research", new_callable=AsyncMock
+)
 async def test_deep_research_tool_long_report_snippet(mock_fetch):
     """Test that snippet is truncated for long reports."""
     # Setup mock with very long report
@@ -159,3 +172,29 @@ async def test_deep_research_tool_long_report_snippet(mock_fetch):
     snippet = result["results"][0]["snippet"]
     assert len(snippet) == 503  # 500 + "..."
     assert snippet.endswith("...")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("tools.deep_research_tool.PERPLEXITY_API_KEY", "test_key")
+@patch(
+    "tools.deep_research_tool.fetch_perplexity_deep_research", new_callable=AsyncMock
+)
+async def test_deep_research_tool_coalesces_identical_requests(mock_fetch):
+    """Test that concurrent identical requests share one Perplexity call."""
+
+    # Setup mock that takes a moment to answer
+    async def slow_research(**kwargs):
+        await asyncio.sleep(0.05)
+        return ("Shared research", [])
+
+    mock_fetch.side_effect = slow_research
+
+    # Call tool concurrently
+    results = await asyncio.gather(
+        deep_research_tool(query="Test"), deep_research_tool(query="Test")
+    )
+
+    # Both callers get the result of a single upstream call
+    assert results[0] == results[1]
+    mock_fetch.assert_called_once()
@@ -9,8 +9,9 @@ from unittest.mock import patch
 
 import pytest
 
-from models.search_result import SearchResult
-from tests.builders.api_search_result_builder import an_api_search_result
+from constants import MAX_SEARCH_RESULTS
+from models.responses.search_response import SearchResponse
+from services.search_orchestrator import format_no_results_error
 from tools.search_tool import search_tool
 
 
@@ -18,21 +19,21 @@ class TestSearchTool:
     """Tests for search tool."""
 
     @pytest.mark.asyncio
-    @patch("tools.search_tool.process_search_results")
-    @patch("tools.search_tool.fetch_with_fallback")
-    async def test_returns_search_results(self, mock_fetch, mock_process):
+    @patch("tools.search_tool.execute_cached_search")
+    async def test_returns_search_results(self, mock_execute):
         # Arrange
-        api_results = [an_api_search_result().build()]
-        processed = [
-            SearchResult(
-                title="Test",
-                url="https://test.com",
-                snippet="Snippet",
-                content="Content",
-            )
-        ]
-        mock_fetch.return_value = (api_results, "Serper API")
-        mock_process.return_value = processed
+        mock_execute.return_value = {
+            "query": "test query",
+            "search_source": "Serper API",
+            "results": [
+                {
+                    "title": "Test",
+                    "url": "https://test.com",
+                    "snippet": "Snippet",
+                    "content": "Content",
+                }
+            ],
+        }
 
         # Act
         result = await search_tool("test query", max_results=5)
@@ -42,12 +43,15 @@ class TestSearchTool:
         assert result["search_source"] == "Serper API"
         assert len(result["results"]) == 1
         assert result["results"][0]["title"] == "Test"
+        assert result["error"] is None
 
     @pytest.mark.asyncio
-    @patch("tools.search_tool.fetch_with_fallback")
-    async def test_returns_error_when_no_results(self, mock_fetch):
+    @patch("tools.search_tool.execute_cached_search")
+    async def test_returns_error_when_no_results(self, mock_execute):
         # Arrange
-        mock_fetch.return_value = ([], "DuckDuckGo (free fallback)")
+        mock_execute.return_value = format_no_results_error(
+            "test query", "DuckDuckGo (free fallback)"
+        )
 
         # Act
         result = await search_tool("test query", max_results=5)
@@ -58,48 +62,55 @@ class TestSearchTool:
         assert len(result["results"]) == 0
 
     @pytest.mark.asyncio
-    @patch("tools.search_tool.process_search_results")
-    @patch("tools.search_tool.fetch_with_fallback")
-    async def test_processes_results_correctly(self, mock_fetch, mock_process):
+    @patch("tools.search_tool.execute_cached_search")
+    async def test_response_matches_search_response_dump(self, mock_execute):
         # Arrange
-        api_results = [
-            an_api_search_result()
-            .with_title("T")
-            .with_link("L")
-            .with_snippet("S")
-            .build()
-        ]
-        mock_fetch.return_value = (api_results, "Source")
-        mock_process.return_value = []
+        mock_execute.return_value = format_no_results_error("q", "Serper API")
 
         # Act
-        await search_tool("query", max_results=5)
+        result = await search_tool("q")
 
         # Assert
-        mock_process.assert_called_once_with(api_results)
+        assert result == SearchResponse(**result).model_dump()
 
     @pytest.mark.asyncio
-    @patch("tools.search_tool.fetch_with_fallback")
-    async def test_respects_max_results_parameter(self, mock_fetch):
+    @patch("tools.search_tool.execute_cached_search")
+    async def test_respects_max_results_parameter(self, mock_execute):
         # Arrange
-        api_results = [an_api_search_result().build()]
-        mock_fetch.return_value = (api_results, "Serper API")
+        mock_execute.return_value = format_no_results_error("q", "Serper API")
 
         # Act
         await search_tool("test query", max_results=10)
 
         # Assert
-        mock_fetch.assert_called_once_with("test query", "", 10)
+        mock_execute.assert_called_once_with("test query", "", 10)
 
     @pytest.mark.asyncio
-    @patch("tools.search_tool.fetch_with_fallback")
-    async def test_uses_default_max_results(self, mock_fetch):
+    @patch("tools.search_tool.execute_cached_search")
+    async def test_uses_default_max_results(self, mock_execute):
         # Arrange
-        api_results = [an_api_search_result().build()]
-        mock_fetch.return_value = (api_results, "Serper API")
+        mock_execute.return_value = format_no_results_error("q", "Serper API")
 
         # Act
         await search_tool("test query")
 
         # Assert
-        mock_fetch.assert_called_once_with("test query", "", 5)
+        mock_execute.assert_called_once_with("test query", "", 5)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "requested, expected",
+        [(500, MAX_SEARCH_RESULTS), (0, 1), (-3, 1)],
+    )
+    @patch("tools.search_tool.execute_cached_search")
+    async def test_clamps_max_results_to_bounds(
+        self, mock_execute, requested, expected
+    ):
+        # Arrange
+        mock_execute.return_value = format_no_results_error("q", "Serper API")
+
+        # Act
+        await search_tool("test query", max_results=requested)
+
+        # Assert
+        mock_execute.assert_called_once_with("test query", "", expected)
@@ -0,0 +1,89 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for the circuit breaker."""
+
+from unittest.mock import patch
+
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        # Arrange
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+
+        # Act
+        breaker.record_failure()
+        still_closed = breaker.allow_request()
+        breaker.record_failure()
+
+        # Assert
+        assert still_closed is True
+        assert breaker.state == OPEN
+        assert breaker.allow_request() is False
+
+    def test_success_resets_failure_count(self):
+        # Arrange
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+        breaker.record_failure()
+
+        # Act
+        breaker.record_success()
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CLOSED
+
+    @patch("utils.circuit_breaker.time.monotonic")
+    def test_allows_single_probe_after_reset_timeout(self, mock_monotonic):
+        # Arrange
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+        mock_monotonic.return_value = 100.0
+        breaker.record_failure()
+
+        # Act
+        mock_monotonic.return_value = 131.0
+        probe_allowed = breaker.allow_request()
+        second_allowed = breaker.allow_request()
+
+        # Assert
+        assert probe_allowed is True
+        assert second_allowed is False
+        assert breaker.state == HALF_OPEN
+
+    @patch("utils.circuit_breaker.time.monotonic")
+    def test_failed_probe_reopens_breaker(self, mock_monotonic):
+        # Arrange
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30)
+        mock_monotonic.return_value = 100.0
+        for _ in range(3):
+            breaker.record_failure()
+        mock_monotonic.return_value = 131.0
+        breaker.allow_request()
+
+        # Act
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == OPEN
+        assert breaker.allow_request() is False
+
+    @patch("utils.circuit_breaker.time.monotonic")
+    def test_abandoned_probe_is_retried_after_reset_timeout(self, mock_monotonic):
+        # Arrange
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+        mock_monotonic.return_value = 100.0
+        breaker.record_failure()
+        mock_monotonic.return_value = 131.0
+        breaker.allow_request()
+
+        # Act
+        mock_monotonic.return_value = 162.0
+
+        # Assert
+        assert breaker.allow_request() is True
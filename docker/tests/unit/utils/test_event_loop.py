@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for event loop selection."""
+
+import asyncio
+import types
+from unittest.mock import patch
+
+import pytest
+
+from utils.event_loop import install_uvloop
+
+
+@pytest.fixture
+def restore_loop_policy():
+    """Put back the event loop policy a test replaced."""
+    policy = asyncio.get_event_loop_policy()
+    yield
+    asyncio.set_event_loop_policy(policy)
+
+
+class TestInstallUvloop:
+    """Tests for install_uvloop."""
+
+    def test_keeps_default_loop_when_uvloop_is_missing(self, restore_loop_policy):
+        # Arrange
+        policy = asyncio.get_event_loop_policy()
+
+        # Act
+        with patch.dict("sys.modules", {"uvloop": None}):
+            installed = install_uvloop()
+
+        # Assert
+        assert installed is False
+        assert asyncio.get_event_loop_policy() is policy
+
+    def test_sets_uvloop_policy_when_available(self, restore_loop_policy):
+        # Arrange - a stand-in module exposing uvloop's policy class
+        class FakePolicy(asyncio.DefaultEventLoopPolicy):
+            pass
+
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.EventLoopPolicy = FakePolicy
+
+        # Act
+        with patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+            installed = install_uvloop()
+
+        # Assert
+        assert installed is True
+        assert isinstance(asyncio.get_event_loop_policy(), FakePolicy)
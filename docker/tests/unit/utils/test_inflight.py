@@ -0,0 +1,116 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for in-flight request coalescing."""
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock
+
+import pytest
+
+from utils.inflight import InflightRequests
+
+
+class TestInflightRequests:
+    """Tests for InflightRequests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_with_same_key_share_one_result(self):
+        # Arrange
+        inflight = InflightRequests()
+
+        async def slow_call():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        func = AsyncMock(side_effect=slow_call)
+
+        # Act
+        results = await asyncio.gather(
+            inflight.run("key", func), inflight.run("key", func)
+        )
+
+        # Assert
+        assert results == ["result", "result"]
+        func.assert_awaited_once()
+        assert len(inflight) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        # Arrange
+        inflight = InflightRequests()
+        func = AsyncMock(return_value="result")
+
+        # Act
+        await asyncio.gather(inflight.run("a", func), inflight.run("b", func))
+
+        # Assert
+        assert func.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_joiners_receive_the_shared_exception(self):
+        # Arrange
+        inflight = InflightRequests()
+
+        async def failing_call():
+            await asyncio.sleep(0.02)
+            raise ValueError("upstream failed")
+
+        # Act
+        results = await asyncio.gather(
+            inflight.run("key", failing_call),
+            inflight.run("key", failing_call),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(inflight) == 0
+
+    @pytest.mark.asyncio
+    async def test_unjoined_failure_is_not_reported_as_unretrieved(self):
+        # Arrange
+        inflight = InflightRequests()
+        loop = asyncio.get_running_loop()
+        reported = []
+        loop.set_exception_handler(lambda loop, context: reported.append(context))
+
+        async def failing_call():
+            raise RuntimeError("upstream down")
+
+        # Act
+        try:
+            await inflight.run("key", failing_call)
+        except RuntimeError:
+            pass
+        gc.collect()
+
+        # Assert
+        loop.set_exception_handler(None)
+        assert reported == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_starter_does_not_fail_joiners(self):
+        # Arrange
+        inflight = InflightRequests()
+
+        async def slow_call():
+            await asyncio.sleep(0.05)
+            return "result"
+
+        starter = asyncio.ensure_future(inflight.run("key", slow_call))
+        await asyncio.sleep(0)
+        joiner = asyncio.ensure_future(inflight.run("key", slow_call))
+        await asyncio.sleep(0)
+
+        # Act
+        starter.cancel()
+        result = await joiner
+
+        # Assert
+        assert starter.cancelled()
+        assert result == "result"
+        assert len(inflight) == 0
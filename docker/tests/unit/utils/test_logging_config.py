@@ -6,9 +6,10 @@
 """Unit tests for logging configuration."""
 
 import logging
+import logging.handlers
 import os
 
-from utils.logging_config import setup_logging
+from utils.logging_config import LOG_LISTENERS, setup_logging, stop_log_listener
 
 
 class TestLoggingConfig:
@@ -57,4 +58,20 @@ class TestLoggingConfig:
         logger = setup_logging("test_handlers.log")
 
         # Assert
-        assert len(logger.handlers) >= 2  # Console + File handler
+        assert len(LOG_LISTENERS[None].handlers) >= 2  # Console + File handler
+        assert any(
+            isinstance(handler, logging.handlers.QueueHandler)
+            for handler in logger.handlers
+        )
+
+    def test_writes_records_off_the_calling_thread(self, temp_test_dir):
+        # Arrange
+        os.environ["LOG_DIR"] = str(temp_test_dir)
+        logger = setup_logging("test_queue.log", logger_name="test_queue")
+
+        # Act
+        logger.warning("queued %s", "message")
+        stop_log_listener("test_queue")  # Drains the queue
+
+        # Assert
+        assert "queued message" in (temp_test_dir / "test_queue.log").read_text()
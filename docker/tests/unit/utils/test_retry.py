@@ -0,0 +1,75 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for async retry with backoff."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from utils.retry import backoff_delay, retry_async
+
+
+def always_retryable(error: Exception) -> bool:
+    return True
+
+
+def never_retryable(error: Exception) -> bool:
+    return False
+
+
+class TestRetryAsync:
+    """Tests for retry_async."""
+
+    @pytest.mark.asyncio
+    @patch("utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_transient_failures_until_success(self, mock_sleep):
+        # Arrange
+        func = AsyncMock(side_effect=[ConnectionError("reset"), "ok"])
+
+        # Act
+        result = await retry_async(func, always_retryable)
+
+        # Assert
+        assert result == "ok"
+        assert func.await_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_does_not_retry_permanent_failures(self, mock_sleep):
+        # Arrange
+        func = AsyncMock(side_effect=PermissionError("unauthorized"))
+
+        # Act & Assert
+        with pytest.raises(PermissionError):
+            await retry_async(func, never_retryable)
+        assert func.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_raises_last_error_after_all_attempts(self, mock_sleep):
+        # Arrange
+        func = AsyncMock(side_effect=ConnectionError("reset"))
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await retry_async(func, always_retryable, attempts=3)
+        assert func.await_count == 3
+        assert mock_sleep.await_count == 2
+
+
+class TestBackoffDelay:
+    """Tests for backoff_delay."""
+
+    def test_delay_grows_exponentially_and_is_capped(self):
+        # Arrange & Act
+        delays = [backoff_delay(attempt, 0.1, 1.0) for attempt in range(6)]
+
+        # Assert
+        assert 0.05 <= delays[0] <= 0.15
+        assert 0.1 <= delays[1] <= 0.3
+        assert all(delay <= 1.5 for delay in delays)
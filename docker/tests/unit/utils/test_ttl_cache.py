@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Unit tests for the TTL cache."""
+
+from unittest.mock import patch
+
+from utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_returns_stored_value(self):
+        # Arrange
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+
+        # Act
+        cache.set("query", {"results": []})
+
+        # Assert
+        assert cache.get("query") == {"results": []}
+        assert cache.get("missing") is None
+
+    @patch("utils.ttl_cache.time.monotonic")
+    def test_expires_entries_after_ttl(self, mock_monotonic):
+        # Arrange
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        mock_monotonic.return_value = 1000.0
+        cache.set("query", "value")
+
+        # Act
+        mock_monotonic.return_value = 1061.0
+
+        # Assert
+        assert cache.get("query") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_entry(self):
+        # Arrange
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.set("c", 3)
+
+        # Assert
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
@@ -5,6 +5,7 @@
 
 """Setup functions for API tools in FastMCP WebCat integration."""
 
+import asyncio
 import logging
 import os
 import time
@@ -12,20 +13,47 @@ from typing import Any, Dict
 
 from fastmcp import Context, FastMCP
 
-from constants import CAPABILITIES, SERVICE_NAME, VERSION
-from models.api_responses import (
+from constants import (
+    CAPABILITIES,
+    DEFAULT_SEARCH_RESULTS,
+    HEALTH_CACHE_TTL_SECONDS,
+    SCRAPE_CACHE_MAX_ENTRIES,
+    SCRAPE_CACHE_TTL_SECONDS,
+    SERVICE_NAME,
+    VERSION,
+)
+from models.domain.search_result import SearchResult
+from models.responses.api_responses import (
     APIHealthCheckResponse,
     APIScrapeResponse,
     APISearchToolResponse,
     APIServerInfoResponse,
 )
-from models.search_result import SearchResult
 from services.content_scraper import scrape_search_result
-from services.search_orchestrator import execute_search
+from services.search_orchestrator import clamp_max_results, execute_cached_search
 from utils.auth import validate_bearer_token
+from utils.executors import SCRAPE_POOL
+from utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Repeat URLs within the TTL are answered without any network calls
+SCRAPE_CACHE = TTLCache(SCRAPE_CACHE_MAX_ENTRIES, SCRAPE_CACHE_TTL_SECONDS)
+
+# Monitors poll health checks tightly; answer repeats from memory briefly
+HEALTH_CACHE = TTLCache(1, HEALTH_CACHE_TTL_SECONDS)
+
+# Static responses never change at runtime, so validate and dump them once
+HEALTHY_RESPONSE = APIHealthCheckResponse(
+    success=True, status="healthy", service="webcat"
+).model_dump()
+SERVER_INFO_RESPONSE = APIServerInfoResponse(
+    success=True,
+    version=VERSION,
+    server=SERVICE_NAME,
+    features=CAPABILITIES,
+).model_dump()
+
 
 def setup_search_tool(mcp: FastMCP, search_func):
     """Setup search tool for MCP server."""
@@ -36,11 +64,12 @@ def setup_search_tool(mcp: FastMCP, search_func):
     )
     async def search_tool(query: str, ctx: Context, max_results: int = 5) -> dict:
         """Search the web for information on a given query."""
+        max_results = clamp_max_results(max_results)
         try:
             # Validate authentication if WEBCAT_API_KEY is set
             is_valid, error_msg = validate_bearer_token(ctx)
             if not is_valid:
-                logger.warning(f"Authentication failed: {error_msg}")
+                logger.warning("Authentication failed: %s", error_msg)
                 response = APISearchToolResponse(
                     success=False,
                     query=query,
@@ -53,31 +82,28 @@ def setup_search_tool(mcp: FastMCP, search_func):
                 return response.model_dump()
 
             logger.info(
-                f"Processing search request: {query} (max {max_results} results)"
+                "Processing search request: %s (max %d results)", query, max_results
             )
 
-            result: dict = await search_func(query)
-
-            # Limit results if specified
-            note: str = ""
+            # Results are limited before scraping, so no truncation is needed here
+            result: dict = await search_func(query, max_results)
             results = result.get("results", [])
-            if results and len(results) > max_results:
-                results = results[:max_results]
-                note = f"Results limited to {max_results} items"
 
-            response = APISearchToolResponse(
-                success=True,
-                query=query,
-                max_results=max_results,
-                search_source=result.get("search_source", "Unknown"),
-                results=results,
-                total_found=len(results),
-                note=note,
-            )
-            return response.model_dump()
+            # Results were already validated upstream; this mirrors the
+            # APISearchToolResponse dump without building the model
+            return {
+                "success": True,
+                "query": query,
+                "max_results": max_results,
+                "search_source": result.get("search_source", "Unknown"),
+                "results": results,
+                "total_found": len(results),
+                "note": "",
+                "error": None,
+            }
 
         except Exception as e:
-            logger.error(f"Error in search tool: {str(e)}")
+            logger.exception("Error in search tool")
             response = APISearchToolResponse(
                 success=False,
                 query=query,
@@ -101,21 +127,24 @@ def setup_health_check_tool(mcp: FastMCP, health_func):
         try:
             logger.info("Processing health check request")
 
-            if health_func:
+            if not health_func:
+                return dict(HEALTHY_RESPONSE)
+
+            response = HEALTH_CACHE.get(health_func)
+            if response is None:
+                # Mirrors the APIHealthCheckResponse dump without building the model
                 result = await health_func()
-                response = APIHealthCheckResponse(
-                    success=True,
-                    status=result.get("status", "unknown"),
-                    service=result.get("service", "webcat"),
-                )
-            else:
-                response = APIHealthCheckResponse(
-                    success=True, status="healthy", service="webcat"
-                )
-            return response.model_dump()
+                response = {
+                    "success": True,
+                    "status": result.get("status", "unknown"),
+                    "service": result.get("service", "webcat"),
+                    "error": None,
+                }
+                HEALTH_CACHE.set(health_func, response)
+            return dict(response)
 
         except Exception as e:
-            logger.error(f"Error in health check tool: {str(e)}")
+            logger.exception("Error in health check tool")
             response = APIHealthCheckResponse(
                 success=False, status="unhealthy", service="webcat", error=str(e)
             )
@@ -131,24 +160,35 @@ def setup_scrape_tool(mcp: FastMCP):
     async def scrape_url_tool(url: str) -> dict:
         """Scrape content from a specific URL and convert to markdown."""
         try:
-            logger.info(f"Processing scrape request for URL: {url}")
+            logger.info("Processing scrape request for URL: %s", url)
 
-            # Create a SearchResult object for scraping
-            search_result = SearchResult(title="", url=url, snippet="")
+            scraped_result = SCRAPE_CACHE.get(url)
+            if scraped_result is None:
+                # The fields are plain constants, so skip Pydantic validation
+                search_result = SearchResult.model_construct(
+                    title="", url=url, snippet=""
+                )
 
-            # Scrape the content
-            scraped_result = scrape_search_result(search_result)
+                # Scrape the content, caching only successful extractions
+                scraped_result = await asyncio.get_running_loop().run_in_executor(
+                    SCRAPE_POOL, scrape_search_result, search_result
+                )
+                if not scraped_result.scrape_failed:
+                    SCRAPE_CACHE.set(url, scraped_result)
+            else:
+                logger.info("Using cached scrape for URL: %s", url)
 
-            response = APIScrapeResponse(
-                success=True,
-                url=url,
-                title=scraped_result.title,
-                content=scraped_result.content,
-            )
-            return response.model_dump()
+            # Mirrors the APIScrapeResponse dump without building the model
+            return {
+                "success": True,
+                "url": url,
+                "title": scraped_result.title,
+                "content": scraped_result.content,
+                "error": None,
+            }
 
         except Exception as e:
-            logger.error(f"Error in scrape URL tool: {str(e)}")
+            logger.exception("Error in scrape URL tool")
             response = APIScrapeResponse(
                 success=False, url=url, title="", content="", error=str(e)
             )
@@ -164,27 +204,8 @@ def setup_server_info_tool(mcp: FastMCP):
     )
     async def get_server_info_tool() -> dict:
         """Get information about the WebCat server."""
-        try:
-            logger.info("Processing server info request")
-
-            response = APIServerInfoResponse(
-                success=True,
-                version=VERSION,
-                server=SERVICE_NAME,
-                features=CAPABILITIES,
-            )
-            return response.model_dump()
-
-        except Exception as e:
-            logger.error(f"Error in server info tool: {str(e)}")
-            response = APIServerInfoResponse(
-                success=False,
-                version="unknown",
-                server=SERVICE_NAME,
-                features=[],
-                error=str(e),
-            )
-            return response.model_dump()
+        logger.info("Processing server info request")
+        return {**SERVER_INFO_RESPONSE, "features": list(CAPABILITIES)}
 
 
 def setup_webcat_tools(mcp: FastMCP, webcat_functions: Dict[str, Any]):
@@ -204,9 +225,11 @@ def create_webcat_functions() -> Dict[str, Any]:
     """Create a dictionary of WebCat functions for the tools to use."""
     SERPER_API_KEY = os.environ.get("SERPER_API_KEY", "")
 
-    async def search_function(query: str) -> Dict[str, Any]:
+    async def search_function(
+        query: str, max_results: int = DEFAULT_SEARCH_RESULTS
+    ) -> Dict[str, Any]:
         """Wrapper for the search functionality."""
-        return await execute_search(query, SERPER_API_KEY)
+        return await execute_cached_search(query, SERPER_API_KEY, max_results)
 
     async def health_check_function() -> Dict[str, Any]:
         """Wrapper for the health check functionality."""
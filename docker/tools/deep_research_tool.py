@@ -10,14 +10,18 @@ import os
 from typing import Literal
 
 from clients.perplexity_client import fetch_perplexity_deep_research
-from models.search_response import SearchResponse
-from models.search_result import SearchResult
+from models.domain.search_result import SearchResult
+from models.responses.search_response import SearchResponse
+from utils.inflight import InflightRequests
 
 logger = logging.getLogger(__name__)
 
 # Get API key from environment
 PERPLEXITY_API_KEY = os.environ.get("PERPLEXITY_API_KEY", "")
 
+# Identical research requests made at the same time share one Perplexity call
+RESEARCH_INFLIGHT = InflightRequests()
+
 
 async def deep_research_tool(
     query: str,
@@ -43,8 +47,10 @@ async def deep_research_tool(
         Dict representation of SearchResponse with comprehensive research findings
     """
     logger.info(
-        f"Deep research request: {query} (effort: {research_effort}, "
-        f"max: {max_results})"
+        "Deep research request: %s (effort: %s, max: %d)",
+        query,
+        research_effort,
+        max_results,
     )
 
     # Check if Perplexity API key is configured
@@ -62,16 +68,19 @@ async def deep_research_tool(
         return response.model_dump()
 
     # Fetch deep research from Perplexity
-    research_report, citation_urls = fetch_perplexity_deep_research(
-        query=query,
-        api_key=PERPLEXITY_API_KEY,
-        max_results=max_results,
-        research_effort=research_effort,
+    research_report, citation_urls = await RESEARCH_INFLIGHT.run(
+        (query, research_effort, max_results),
+        lambda: fetch_perplexity_deep_research(
+            query=query,
+            api_key=PERPLEXITY_API_KEY,
+            max_results=max_results,
+            research_effort=research_effort,
+        ),
     )
 
     # Check if we got research content
     if not research_report:
-        logger.warning(f"No deep research results found for query: {query}")
+        logger.warning("No deep research results found for query: %s", query)
         response = SearchResponse(
             query=query,
             search_source="Perplexity Deep Research",
@@ -116,7 +125,8 @@ async def deep_research_tool(
     )
 
     logger.info(
-        f"Deep research completed: {len(research_report)} chars, "
-        f"{len(citation_urls)} sources cited"
+        "Deep research completed: %d chars, %d sources cited",
+        len(research_report),
+        len(citation_urls),
     )
     return response.model_dump()
@@ -5,7 +5,10 @@
 
 """Health check tool - MCP tool for server health monitoring."""
 
-from models.health_check_response import HealthCheckResponse
+from models.responses.health_check_response import HealthCheckResponse
+
+# The response never changes, so validate and dump it once
+HEALTHY_RESPONSE = HealthCheckResponse(status="healthy", service="webcat").model_dump()
 
 
 async def health_check_tool() -> dict:
@@ -17,7 +20,5 @@ async def health_check_tool() -> dict:
     Returns:
         Dict representation of HealthCheckResponse model (for MCP JSON serialization)
     """
-    # Build typed response
-    response = HealthCheckResponse(status="healthy", service="webcat")
-    # Only convert to dict at MCP boundary for JSON serialization
-    return response.model_dump()
+    # Copy so callers can't mutate the shared response
+    return dict(HEALTHY_RESPONSE)
@@ -7,12 +7,8 @@
 
 import logging
 import os
-from typing import List
 
-from models.search_response import SearchResponse
-from models.search_result import SearchResult
-from services.search_processor import process_search_results
-from services.search_service import fetch_with_fallback
+from services.search_orchestrator import clamp_max_results, execute_cached_search
 
 logger = logging.getLogger(__name__)
 
@@ -28,36 +24,25 @@ async def search_tool(query: str, max_results: int = 5) -> dict:
 
     Args:
         query: The search query string
-        max_results: Maximum number of results to return (default: 5)
+        max_results: Maximum number of results to return (default: 5,
+            clamped to between 1 and MAX_SEARCH_RESULTS)
 
     Returns:
         Dict representation of SearchResponse model (for MCP JSON serialization)
     """
-    logger.info(f"Processing search request: {query} (max {max_results} results)")
-
-    # Fetch results with automatic fallback
-    api_results, search_source = fetch_with_fallback(query, SERPER_API_KEY, max_results)
-
-    # Check if we got any results
-    if not api_results:
-        logger.warning(f"No search results found for query: {query}")
-        response = SearchResponse(
-            query=query,
-            search_source=search_source,
-            results=[],
-            error="No search results found from any source.",
-        )
-        # Only convert to dict at MCP boundary for JSON serialization
-        return response.model_dump()
-
-    # Process the results - typed as List[SearchResult]
-    processed_results: List[SearchResult] = process_search_results(api_results)
-
-    # Build typed response
-    response = SearchResponse(
-        query=query,
-        search_source=search_source,
-        results=processed_results,
-    )
-    # Only convert to dict at MCP boundary for JSON serialization
-    return response.model_dump()
+    max_results = clamp_max_results(max_results)
+    logger.info("Processing search request: %s (max %d results)", query, max_results)
+
+    # Each stage runs on its own pool with its own timeout; pages are scraped
+    # concurrently, one job per URL. Repeat and concurrent identical queries
+    # share one search.
+    result = await execute_cached_search(query, SERPER_API_KEY, max_results)
+
+    # Results were already dumped by the orchestrator; this mirrors the
+    # SearchResponse dump without building the model
+    return {
+        "query": query,
+        "search_source": result.get("search_source", "Unknown"),
+        "results": result.get("results", []),
+        "error": result.get("error"),
+    }
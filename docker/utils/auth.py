@@ -46,11 +46,12 @@ def validate_bearer_token(ctx: Optional[Any] = None) -> tuple[bool, Optional[str
         logger.warning("Authentication required but no context provided")
         return False, "Authentication required: missing bearer token"
 
-    # Debug: log context type and attributes
-    logger.debug(f"Context type: {type(ctx)}")
-    logger.debug(
-        f"Context attributes: {dir(ctx) if hasattr(ctx, '__dir__') else 'N/A'}"
-    )
+    # Debug: log context type and attributes (dir() is costly, so only when enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Context type: %s", type(ctx))
+        logger.debug(
+            "Context attributes: %s", dir(ctx) if hasattr(ctx, "__dir__") else "N/A"
+        )
 
     # Try to extract Authorization header from context
     # FastMCP provides Context object with get_http_request() method
@@ -60,12 +61,12 @@ def validate_bearer_token(ctx: Optional[Any] = None) -> tuple[bool, Optional[str
     if Context and isinstance(ctx, Context):
         try:
             request = ctx.get_http_request()
-            logger.debug(f"HTTP request: {request}")
+            logger.debug("HTTP request: %s", request)
             if request and hasattr(request, "headers"):
                 headers = dict(request.headers)
-                logger.debug(f"Extracted headers: {headers}")
+                logger.debug("Extracted headers: %s", headers)
         except Exception as e:
-            logger.warning(f"Failed to get HTTP request from context: {e}")
+            logger.warning("Failed to get HTTP request from context: %s", e)
 
     # Fallback: try direct attribute access
     if headers is None and hasattr(ctx, "headers"):
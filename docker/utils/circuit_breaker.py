@@ -0,0 +1,81 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Circuit breaker for skipping upstream providers during outages."""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops calling a failing provider until a cool-down has passed.
+
+    The breaker opens after ``failure_threshold`` consecutive failures. While
+    open, requests are refused so callers can go straight to their fallback.
+    Once ``reset_timeout`` seconds have passed a single probe request is let
+    through (half-open); its outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        """Create a closed breaker.
+
+        Args:
+            name: Provider name used in log messages
+            failure_threshold: Consecutive failures before the breaker opens
+            reset_timeout: Seconds to wait before probing an open provider
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.reset()
+
+    def reset(self) -> None:
+        """Close the breaker and forget past failures."""
+        self.state = CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Check whether the provider should be called right now.
+
+        Returns:
+            True if the call may proceed, False if it should be skipped
+        """
+        if self.state == CLOSED:
+            return True
+
+        # A probe that never reported back (e.g. it was cancelled) also times out
+        now = time.monotonic()
+        if now - self.opened_at >= self.reset_timeout:
+            logger.info("%s circuit half-open, sending probe request", self.name)
+            self.state = HALF_OPEN
+            self.opened_at = now
+            return True
+
+        # Open and cooling down, or a probe is already in flight
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        if self.state != CLOSED:
+            logger.info("%s circuit closed", self.name)
+        self.reset()
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        self.failure_count += 1
+        if self.state == HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning(
+                    "%s circuit open after %d failures", self.name, self.failure_count
+                )
+            self.state = OPEN
+            self.opened_at = time.monotonic()
@@ -0,0 +1,31 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Event loop selection for the server entry points."""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for new asyncio event loops when it is installed.
+
+    Must be called before the server starts its event loop. uvloop is not
+    available on Windows, where the default asyncio loop is kept.
+
+    Returns:
+        True if uvloop was installed, False if using the default loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not available, using the default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
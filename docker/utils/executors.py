@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Dedicated thread pools for blocking search and scrape work.
+
+Search and scraping each get their own bounded pool instead of sharing the
+event loop's default executor, so a backlog of slow page fetches can't delay
+search API calls (and vice versa).
+
+HTML-to-markdown extraction is CPU bound and serialized by the GIL, so it can
+optionally be offloaded to a process pool. That pool is disabled by default:
+pickling large pages across processes can cost more than it saves, so enable
+it with WEBCAT_PARSE_PROCESSES only after measuring on the target host.
+"""
+
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+
+def _worker_count(env_var: str, default: int) -> int:
+    """Read a pool size from the environment, falling back to the default."""
+    try:
+        return max(1, int(os.environ.get(env_var, default)))
+    except ValueError:
+        return default
+
+
+SEARCH_POOL = ThreadPoolExecutor(
+    max_workers=_worker_count("WEBCAT_SEARCH_WORKERS", 8),
+    thread_name_prefix="webcat-search",
+)
+SCRAPE_POOL = ThreadPoolExecutor(
+    max_workers=_worker_count("WEBCAT_SCRAPE_WORKERS", 8),
+    thread_name_prefix="webcat-scrape",
+)
+
+
+def _process_count(env_var: str) -> int:
+    """Read an optional process count from the environment (0 disables)."""
+    try:
+        return max(0, int(os.environ.get(env_var, 0)))
+    except ValueError:
+        return 0
+
+
+_parse_processes = _process_count("WEBCAT_PARSE_PROCESSES")
+
+# Spawn rather than fork: forking a process that already runs thread pools
+# and an event loop can deadlock the children.
+PARSE_POOL: Optional[ProcessPoolExecutor] = (
+    ProcessPoolExecutor(
+        max_workers=_parse_processes,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    if _parse_processes
+    else None
+)
+
+atexit.register(SEARCH_POOL.shutdown, wait=False)
+atexit.register(SCRAPE_POOL.shutdown, wait=False)
+if PARSE_POOL is not None:
+    atexit.register(PARSE_POOL.shutdown, wait=False)
@@ -0,0 +1,60 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Coalescing of identical concurrent requests into one upstream call."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class InflightRequests:
+    """Tracks calls in progress so duplicate callers can join them.
+
+    The first caller for a key starts the call as its own task; anyone asking
+    for the same key before it finishes awaits that task's result (or
+    exception) instead of starting another upstream request. Every caller,
+    the starter included, awaits through ``asyncio.shield``, so cancelling
+    any one of them never cancels the shared call for the rest. An instance
+    must only be used from coroutines on a single event loop; it takes no
+    lock.
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._pending: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run func for key, or join the identical call already in progress.
+
+        Args:
+            key: Identifies requests that can share one result
+            func: Zero-argument coroutine function doing the real work
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        """Drop a finished call so the next request for key starts afresh."""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        # Mark the exception retrieved so a call whose callers were all
+        # cancelled doesn't log "exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def __len__(self) -> int:
+        return len(self._pending)
@@ -5,11 +5,13 @@
 
 """Centralized logging configuration for WebCat."""
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import tempfile
-from typing import Optional
+from typing import Dict, Optional
 
 from constants import (
     DEFAULT_LOG_FILE,
@@ -17,6 +19,29 @@ from constants import (
     LOG_FILE_MAX_BYTES,
 )
 
+# Background writers doing console and file output, per configured logger
+LOG_LISTENERS: Dict[Optional[str], logging.handlers.QueueListener] = {}
+
+
+def stop_log_listener(logger_name: Optional[str] = None) -> None:
+    """Flush queued records and stop a logger's background writer, if running.
+
+    Args:
+        logger_name: Name the logger was set up with (None for root logger)
+    """
+    listener = LOG_LISTENERS.pop(logger_name, None)
+    if listener is not None:
+        listener.stop()
+
+
+def _stop_all_log_listeners() -> None:
+    """Flush and stop every background log writer at interpreter exit."""
+    for logger_name in list(LOG_LISTENERS):
+        stop_log_listener(logger_name)
+
+
+atexit.register(_stop_all_log_listeners)
+
 
 def setup_logging(
     log_file_name: str = DEFAULT_LOG_FILE, logger_name: Optional[str] = None
@@ -24,6 +49,10 @@ def setup_logging(
     """
     Setup logging with console and rotating file handlers.
 
+    Records are handed to a queue on the calling thread, and a background
+    listener does the console and file I/O (including rotation), so logging
+    from the event loop never blocks on disk writes.
+
     Args:
         log_file_name: Name of the log file (e.g., "webcat.log", "webcat_demo.log")
         logger_name: Name of the logger (None for root logger)
@@ -45,6 +74,7 @@ def setup_logging(
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
+    stop_log_listener(logger_name)
 
     # Create formatters
     console_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
@@ -55,7 +85,6 @@ def setup_logging(
     # Setup console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
     # Setup rotating file handler
     file_handler = logging.handlers.RotatingFileHandler(
@@ -65,7 +94,12 @@ def setup_logging(
         encoding="utf-8",
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
-    logger.info(f"Logging initialized with file rotation at {log_file}")
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+    LOG_LISTENERS[logger_name] = listener
+
+    logger.info("Logging initialized with file rotation at %s", log_file)
     return logger
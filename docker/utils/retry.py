@@ -0,0 +1,69 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Bounded retries with exponential backoff and jitter for async calls."""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Compute the jittered delay before the next attempt.
+
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        base_delay: Delay in seconds after the first failure, before jitter
+        max_delay: Upper bound on the delay before jitter
+
+    Returns:
+        Delay in seconds
+    """
+    return min(max_delay, base_delay * 2**attempt) * random.uniform(0.5, 1.5)
+
+
+async def retry_async(
+    func: Callable[[], Awaitable[T]],
+    is_retryable: Callable[[Exception], bool],
+    attempts: int = 3,
+    base_delay: float = 0.1,
+    max_delay: float = 1.0,
+) -> T:
+    """Await func, retrying transient failures with exponential backoff.
+
+    Args:
+        func: Zero-argument coroutine function to call
+        is_retryable: Returns True for errors worth another attempt
+        attempts: Maximum number of calls, including the first
+        base_delay: Delay in seconds after the first failure, before jitter
+        max_delay: Upper bound on the delay before jitter
+
+    Returns:
+        The first successful result of func
+
+    Raises:
+        Exception: The last error, or the first one that isn't retryable
+    """
+    for attempt in range(attempts):
+        try:
+            return await func()
+        except Exception as error:
+            if attempt == attempts - 1 or not is_retryable(error):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            logger.warning(
+                "Transient error (%s), retrying in %.2fs (attempt %d of %d)",
+                error,
+                delay,
+                attempt + 2,
+                attempts,
+            )
+            await asyncio.sleep(delay)
+    raise ValueError("attempts must be at least 1")
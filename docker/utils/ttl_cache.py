@@ -0,0 +1,76 @@
+# Copyright (c) 2024 Travis Frisinger
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Bounded in-process cache with per-entry expiry."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Least-recently-used cache whose entries expire after a fixed TTL.
+
+    Reads and writes take an internal lock, so a single instance is safe to
+    share between coroutines and worker threads. Cached values are returned
+    as-is; callers must treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting the oldest
+            ttl_seconds: Seconds an entry stays valid after it is stored
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)